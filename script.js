@@ -200,6 +200,13 @@ const App = {
     // Projetos - Gere a exibição de projetos em cards e a visualização do modal
     projetos: {
         "ImagensEmLoop": false,
+        // Variantes redimensionadas (AVIF/WebP) geradas por scripts/imagens_responsivas.py, indexadas pelo URL original
+        imagensResponsivas: {},
+        tamanhosImagens: {
+            card: '(max-width: 600px) 100vw, 400px',
+            modal: 'min(100vw, 1000px)',
+            miniatura: '100px',
+        },
         "dadosProjetos": [
             {
                 "id": 1,
@@ -293,12 +300,13 @@ const App = {
             this.criarEstruturaModal();
 
             // Tenta carregar dados pré-buscados (gerados pelo script Python) para evitar chamadas ao GitHub em runtime
-            try {
-                await this.loadLocalGithubData();
-            } catch (e) {
-                // se falhar, continuamos com os dados locais definidos no código
-                console.info('loadLocalGithubData falhou ou não existe (ok):', e.message);
-            }
+            // O mapa de imagens é independente dos dados do GitHub: pedidos em paralelo
+            const [dadosGithub, imagens] = await Promise.allSettled([this.loadLocalGithubData(), this.carregarImagensResponsivas()]);
+            // se falhar, continuamos com os dados locais definidos no código / imagens originais
+            if (dadosGithub.status === 'rejected')
+                console.info('loadLocalGithubData falhou ou não existe (ok):', dadosGithub.reason?.message);
+            if (imagens.status === 'rejected')
+                console.info('Mapa de imagens responsivas indisponível (ok):', imagens.reason?.message);
 
             // Gera os cards usando função dedicada
             this.CarregarCardsDeProjetos();
@@ -337,18 +345,23 @@ const App = {
             }
         }
 ,
-    // Tenta ler o arquivo gerado pelo script Python (data/github_projects.json)
+    // Tenta ler os dados gerados pelo script Python.
+    // Preferência pelo índice leve (data/github_projects.index.json), cujo HTML de cada projeto
+    // fica num ficheiro próprio carregado só ao abrir o modal; se não existir, usa o ficheiro completo.
         async loadLocalGithubData() {
-            const path = '/data/github_projects.json';
-            let resp;
-
-            try {
-                resp = await fetch(path, { cache: 'no-cache' });
-            } catch (e) { throw e; }
-
-            if (!resp.ok) { throw new Error(`HTTP ${resp.status}`); }
+            const caminhos = ['/data/github_projects.index.json', '/data/github_projects.json'];
+            let projects;
 
-            const projects = await resp.json();
+            for (const path of caminhos) {
+                try {
+                    const resp = await fetch(path, { cache: 'no-cache' });
+                    if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
+                    projects = await resp.json();
+                    break;
+                } catch (e) {
+                    if (path === caminhos[caminhos.length - 1]) throw e;
+                }
+            }
 
             if (!Array.isArray(projects)) return;
 
@@ -365,9 +378,52 @@ const App = {
                 if (repoInfo.link) projetoLocal.githubLink = repoInfo.link;
                 if (repoInfo.title) projetoLocal.title = repoInfo.title;
                 if (repoInfo.description_html) projetoLocal.description_html = repoInfo.description_html;
+                if (repoInfo.html_file) projetoLocal.html_file = '/data/' + repoInfo.html_file;
+                if (repoInfo.excerpt) projetoLocal.excerpt = repoInfo.excerpt;
             }
         },
 
+        // Lê data/imagens_responsivas.json (dimensões e srcset de cada imagem de assets/)
+        async carregarImagensResponsivas() {
+            const resp = await fetch('/data/imagens_responsivas.json', { cache: 'no-cache' });
+            if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
+            const mapa = await resp.json();
+            if (mapa && typeof mapa.imagens === 'object') this.imagensResponsivas = mapa.imagens;
+        },
+
+        // Atributos srcset/sizes/width/height (WebP) para uma imagem com variantes; '' se não houver
+        _atributosResponsivos(url, tamanhos) {
+            const info = this.imagensResponsivas[url];
+            if (!info || !info.srcset || !info.srcset.webp) return '';
+            return ` srcset="${info.srcset.webp}" sizes="${tamanhos}" width="${info.largura}" height="${info.altura}"`;
+        },
+
+        // <source> AVIF para usar dentro de <picture> (o navegador escolhe AVIF se o suportar)
+        _fonteAvif(url, tamanhos) {
+            const info = this.imagensResponsivas[url];
+            if (!info || !info.srcset || !info.srcset.avif) return '';
+            return `<source type="image/avif" srcset="${info.srcset.avif}" sizes="${tamanhos}">`;
+        },
+
+        // Carrega (uma única vez) o HTML do projeto a partir do fragmento indicado no índice.
+        // O nome do ficheiro inclui o hash do conteúdo, por isso pode usar a cache normal do navegador.
+        async carregarHtmlDoProjeto(projeto) {
+            if (!projeto || projeto.description_html || !projeto.html_file) return;
+            try {
+                const resp = await fetch(projeto.html_file);
+                if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
+                const html = await resp.text();
+                if (!html.trim()) throw new Error('fragmento vazio');
+                projeto.description_html = html;
+            } catch (e) {
+                console.warn('Não foi possível carregar o HTML do projeto:', e.message);
+                // Sem fragmento: o modal deixa de mostrar "carregando" e passa a "não disponíveis"
+                projeto.falhaHtmlFile = true;
+            }
+            // Só atualiza o modal se ele ainda estiver a mostrar este projeto
+            if (this.estado.projetoAtual === projeto) this.preencherConteudoDeTextoDoModal(projeto);
+        },
+
         /**
          * Converte caracteres especiais em entidades HTML para impedir injeção de código
          * e quebra da marcação quando o conteúdo vem de fontes externas (ex: README, tags).
@@ -487,6 +543,9 @@ const App = {
             if (projeto.description && String(projeto.description).trim() !== '') {
                 texto = String(projeto.description).trim();
             }
+            // Sem descrição, o índice fragmentado traz um excerto em texto plano do README
+            else if (projeto.excerpt && String(projeto.excerpt).trim() !== '')
+                texto = String(projeto.excerpt).trim();
             // Caso não esteja disponivel usa HTML do README já convertido (description_html) → texto plano
             else if (projeto.description_html && String(projeto.description_html).trim() !== '')
                 texto = this._extrairTextoPlano(projeto.description_html);
@@ -508,7 +567,10 @@ const App = {
 
             return `
                 <li class="project-card add-filter-brightness-115 add-shadow-sm">
-                    <img src="${projeto.coverImage || ''}" alt="Capa do projeto ${this.escapeHtml(tituloCard)}" class="card-image" loading="lazy">
+                    <picture>
+                        ${this._fonteAvif(projeto.coverImage, this.tamanhosImagens.card)}
+                        <img src="${projeto.coverImage || ''}"${this._atributosResponsivos(projeto.coverImage, this.tamanhosImagens.card)} alt="Capa do projeto ${this.escapeHtml(tituloCard)}" class="card-image" loading="lazy">
+                    </picture>
                     <div class="card-content">
                         <p class="card-tags">${this.escapeHtml(this.obterTagsParaCard(projeto))}</p>
                         <h3 class="card-title">${this.escapeHtml(tituloCard)}</h3>
@@ -693,8 +755,9 @@ const App = {
             if (this.elementos.imagemPrincipalModal)
                 this.elementos.imagemPrincipalModal.classList.remove('is-broken');
 
-            // Preenche o conteúdo
+            // Preenche o conteúdo (o HTML detalhado pode chegar depois, via fragmento)
             this.preencherConteudoDeTextoDoModal(projeto);
+            this.carregarHtmlDoProjeto(projeto);
             this.carregarMiniaturasAsync(this.estado.imagensDoProjetoAtual);
             if (this.estado.imagensDoProjetoAtual.length > 0)
                 this.mudarImagemModal(0); // Mostra a primeira imagem válida
@@ -798,7 +861,7 @@ const App = {
             listaDeImagens.forEach((urlDaImagem, indice) => {
                 const miniaturaHtml = `
                     <button type="button" data-index="${indice}" class="add-filter-brightness-90">
-                        <img src="${urlDaImagem}" alt="Miniatura ${indice + 1}" loading="lazy">
+                        <img src="${urlDaImagem}"${this._atributosResponsivos(urlDaImagem, this.tamanhosImagens.miniatura)} alt="Miniatura ${indice + 1}" loading="lazy">
                     </button>`;
                 this.elementos.miniaturasModal.insertAdjacentHTML('beforeend', miniaturaHtml);
                 const btn = this.elementos.miniaturasModal.lastElementChild;
@@ -837,7 +900,16 @@ const App = {
             // Atualiza a imagem principal do modal
             if (this.elementos.imagemPrincipalModal)
                 this.elementos.imagemPrincipalModal.classList.remove('is-broken');
-            this.elementos.imagemPrincipalModal.src = this.estado.imagensDoProjetoAtual[indiceCalculado];
+            const urlImagem = this.estado.imagensDoProjetoAtual[indiceCalculado];
+            // O srcset tem prioridade sobre o src, por isso é sempre atualizado (ou removido) junto com ele
+            const infoImagem = this.imagensResponsivas[urlImagem];
+            if (infoImagem && infoImagem.srcset && infoImagem.srcset.webp) {
+                this.elementos.imagemPrincipalModal.sizes = this.tamanhosImagens.modal;
+                this.elementos.imagemPrincipalModal.srcset = infoImagem.srcset.webp;
+            } else {
+                this.elementos.imagemPrincipalModal.removeAttribute('srcset');
+            }
+            this.elementos.imagemPrincipalModal.src = urlImagem;
             this.elementos.imagemPrincipalModal.alt = `Imagem ${indiceCalculado + 1} do projeto ${this.estado.projetoAtual.title || this.estado.projetoAtual.repo}`; // Atualiza o texto da imagem.
 
             // Atualiza a visibilidade das setas se não estiver em loop
@@ -881,6 +953,8 @@ const App = {
             if (this.elementos.tituloModal) this.elementos.tituloModal.innerHTML = `<span class="modal-title-text">${this.escapeHtml(String(tituloModal))}</span>`;
             let conteudoHTML = '';
             if (description_html && description_html.trim()) conteudoHTML = `<div class="modal-section">${description_html}</div>`;
+            // Fragmento do índice ainda a caminho (carregarHtmlDoProjeto volta a preencher o modal quando chegar)
+            else if (projeto.html_file && !projeto.falhaHtmlFile) conteudoHTML = `<div class="modal-section" aria-busy="true"><p>Carregando informações detalhadas...</p></div>`;
             else conteudoHTML = `<div class="modal-section"><p>Informações detalhadas não disponíveis.</p></div>`;
             this.elementos.detalhesModal.innerHTML = conteudoHTML;
             this.elementos.linksModal.innerHTML = this.gerarHtmlLinks(demoLink, githubLink, repo);
@@ -894,7 +968,7 @@ const App = {
             listaDeImagens.forEach((urlDaImagem, indice) => {
                 const miniaturaHtml = `
                     <button type="button" data-index="${indice}" class="add-filter-brightness-90">
-                        <img src="${urlDaImagem}" alt="Miniatura ${indice + 1}" loading="lazy">
+                        <img src="${urlDaImagem}"${this._atributosResponsivos(urlDaImagem, this.tamanhosImagens.miniatura)} alt="Miniatura ${indice + 1}" loading="lazy">
                     </button>`;
                 this.elementos.miniaturasModal.insertAdjacentHTML('beforeend', miniaturaHtml);
                 const btn = this.elementos.miniaturasModal.lastElementChild;
@@ -932,7 +1006,16 @@ const App = {
             // Atualiza a imagem principal do modal
             if (this.elementos.imagemPrincipalModal)
                 this.elementos.imagemPrincipalModal.classList.remove('is-broken');
-            this.elementos.imagemPrincipalModal.src = this.estado.imagensDoProjetoAtual[indiceCalculado];
+            const urlImagem = this.estado.imagensDoProjetoAtual[indiceCalculado];
+            // O srcset tem prioridade sobre o src, por isso é sempre atualizado (ou removido) junto com ele
+            const infoImagem = this.imagensResponsivas[urlImagem];
+            if (infoImagem && infoImagem.srcset && infoImagem.srcset.webp) {
+                this.elementos.imagemPrincipalModal.sizes = this.tamanhosImagens.modal;
+                this.elementos.imagemPrincipalModal.srcset = infoImagem.srcset.webp;
+            } else {
+                this.elementos.imagemPrincipalModal.removeAttribute('srcset');
+            }
+            this.elementos.imagemPrincipalModal.src = urlImagem;
             this.elementos.imagemPrincipalModal.alt = `Imagem ${indiceCalculado + 1} do projeto ${this.estado.projetoAtual.title}`; // Atualiza o texto da imagem.
 
             // Atualiza a visibilidade das setas se não estiver em loop
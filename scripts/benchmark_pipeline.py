@@ -0,0 +1,536 @@
+"""
+Benchmark offline do pipeline README → HTML.
+
+Executa ProcessadorMarkdown, ConversorMarkdownHtml e FormatadorHtml sobre um corpus
+de READMEs (sem rede) e reporta, por etapa, o tempo, a vazão (documentos/s e MB/s)
+e o pico de memória. Resultados podem ser guardados e comparados com uma baseline.
+
+Corpus:
+- README.md deste repositório (uma das fontes de data/github_projects.json);
+- READMEs presentes no cache HTTP (.cache/http), quando já houve uma execução com rede;
+- description_html de data/github_projects.json (etapa de re-higienização);
+- documentos sintéticos grandes e patológicos;
+- ficheiros .md extra passados com --corpus.
+
+Com --stress, corre apenas HTML adversarial (listas sem fecho, aninhamento profundo,
+sequências longas de espaços) pelo FormatadorHtml e falha se algum caso exceder o
+orçamento de tempo: protege a reparação de listas contra regressões quadráticas.
+
+Com --regressao, passa o corpus de scripts/regressao_limpeza_html.json (listas planas,
+itens <li><p> soltos, divisão por ' - ' e listas aninhadas) pelo FormatadorHtml.limpeza_final
+e falha se alguma saída diferir da esperada. Os casos 'plana' têm a saída byte a byte da
+implementação anterior à reparação linear de listas; os 'aninhada' fixam a correção
+intencional do HTML aninhado. --atualizar-regressao regrava as saídas esperadas (só após
+uma mudança de comportamento deliberada).
+
+Com --arranque, mede o arranque dos comandos offline com `python -X importtime`
+(tempo total de import e módulos mais pesados) e falha se algum deles carregar
+requests ou markdown, que só devem ser importados pelos comandos com rede.
+
+Com --http, corre o ClienteGithub contra um servidor HTTP falso local (sem rede) com
+cenários de 5xx, Retry-After e rate limit esgotado, e falha se o número de requisições,
+o resultado ou a espera mínima entre tentativas não forem os esperados. Corre também o
+backend GraphQL (lote completo, repositório null, README ausente, 5xx no lote) e confere
+as requisições GraphQL/REST feitas e os itens produzidos.
+
+Uso:
+    python scripts/benchmark_pipeline.py [--repeticoes N] [--corpus DIR]
+                                         [--salvar-baseline ARQ] [--comparar ARQ]
+    python scripts/benchmark_pipeline.py --stress [--orcamento SEGUNDOS]
+    python scripts/benchmark_pipeline.py --regressao [--atualizar-regressao]
+    python scripts/benchmark_pipeline.py --arranque [--repeticoes N]
+    python scripts/benchmark_pipeline.py --http
+"""
+import sys
+import json
+import time
+import io
+import random
+import threading
+import contextlib
+import subprocess
+import argparse
+import tracemalloc
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import data_github_projects
+from data_github_projects import (
+    DIRETORIO_RAIZ, DIRETORIO_CACHE_HTTP,
+    ProcessadorMarkdown, ConversorMarkdownHtml, FormatadorHtml,
+    ClienteGithub, LimitadorDeTaxa, GerenciadorDeRepositorios, carregar_dados_json,
+)
+
+ETAPAS = ['extrair_titulo_e_corpo', 'limpar_corpo_bruto', 'converter', 'limpeza_final', 'reaplicar_limpeza']
+ORCAMENTO_STRESS_SEGUNDOS = 0.5
+
+DIRETORIO_SCRIPTS = Path(__file__).resolve().parent
+ARQUIVO_REGRESSAO_LIMPEZA = DIRETORIO_SCRIPTS / 'regressao_limpeza_html.json'
+# (nome, argumentos do interpretador); todos devem arrancar sem rede nem markdown
+COMANDOS_ARRANQUE = [
+    ('import data_github_projects', ['-c', 'import data_github_projects']),
+    ('validar', [str(DIRETORIO_SCRIPTS / 'data_github_projects.py'), 'validar']),
+    ('limpar --help', [str(DIRETORIO_SCRIPTS / 'data_github_projects.py'), 'limpar', '--help']),
+]
+MODULOS_PROIBIDOS_OFFLINE = ('requests', 'markdown')
+
+# Cenários do servidor falso: (nome, respostas por ordem, requisições esperadas, sucesso esperado, espera mínima em s).
+# Cada resposta é (status, reset do rate limit relativo a agora ou None, Retry-After ou None);
+# espera mínima None = soma do backoff com jitter para a SEMENTE_HTTP (ver esperar_backoff_semeado)
+CENARIOS_HTTP = [
+    ('5xx transitório', [(502, None, None), (503, None, None), (200, None, None)], 3, True, 0.0),
+    ('Retry-After', [(429, None, '1'), (200, None, None)], 2, True, 1.0),
+    ('reset curto', [(403, 1.0, None), (200, None, None)], 2, True, 0.9),
+    ('reset no passado', [(403, -100.0, None)] * 3 + [(200, None, None)], 4, True, None),
+    ('reset longo', [(403, 3600.0, None)], 1, False, 0.0),
+]
+# Cenários GraphQL: (nome, repositórios 'dono/repo', POSTs GraphQL esperados, GETs REST esperados,
+# {repo: título esperado, ou None se o item não deve ter description_html}).
+# No servidor falso, 'apagado' não existe (null no GraphQL, 404 no REST), 'semreadme' não tem
+# blob README no GraphQL (só no REST) e o dono 'falha5xx' faz o lote responder 502.
+CENARIOS_GRAPHQL = [
+    ('lote completo', ['ok/a', 'ok/b', 'ok/c'], 1, 0, {'a': 'Projeto a', 'b': 'Projeto b', 'c': 'Projeto c'}),
+    # apagado: metadados e /readme REST (404) + 16 sondagens raw (main/master × 8 nomes)
+    ('repositório null', ['nulo/a', 'nulo/apagado'], 1, 18, {'a': 'Projeto a', 'apagado': None}),
+    ('sem blob README', ['blob/a', 'blob/semreadme'], 1, 1, {'a': 'Projeto a', 'semreadme': 'Projeto semreadme'}),
+    # 1 + MAXIMO_RETENTATIVAS POSTs; depois metadados e README via REST para cada repositório
+    ('5xx no lote', ['falha5xx/a', 'falha5xx/b'], 5, 4, {'a': 'Projeto a', 'b': 'Projeto b'}),
+]
+SEMENTE_HTTP = 20240601
+BACKOFF_TESTE_HTTP_SEGUNDOS = 0.2
+
+
+def gerar_documentos_sinteticos(base: str) -> list[tuple[str, str]]:
+    """Entradas grandes e patológicas para as regex do pipeline."""
+    badges = '\n'.join(f'[![Badge {i}](https://img.shields.io/badge/b{i}-x-blue.svg)](https://x)' for i in range(200))
+    lista_longa = '\n'.join(f'- **Item {i}:** descrição - com separador - e mais texto' for i in range(3000))
+    lista_aninhada = '\n'.join(('  ' * (i % 6)) + f'{i}. item numerado' for i in range(2000))
+    paragrafos_em_lista = '\n\n'.join(f'- parágrafo {i}\n\n  continuação do item {i}' for i in range(1500))
+    colchetes = ' '.join(f'[**link {i}**](https://exemplo/{i})' for i in range(5000))
+    # O parser markdown é quadrático em '[' sem fechamento; 2000 já custa ~1 s
+    sem_fechamento = '[' * 2000 + ' texto sem fechar'
+    return [
+        ('sintetico:grande', (base + '\n\n') * 50),
+        ('sintetico:badges', f'{badges}\n\n# Título\n\n{base}'),
+        ('sintetico:lista_longa', f'# Lista\n\n{lista_longa}'),
+        ('sintetico:lista_aninhada', f'# Aninhada\n\n{lista_aninhada}'),
+        ('sintetico:paragrafos_em_lista', f'# Itens\n\n{paragrafos_em_lista}'),
+        ('sintetico:colchetes', f'# Links\n\n{colchetes}'),
+        ('sintetico:colchetes_sem_fechamento', f'# Patológico\n\n{sem_fechamento}'),
+    ]
+
+
+def gerar_html_adversarial() -> list[tuple[str, str]]:
+    """HTML mal formado que levava as antigas regex de listas a tempo quadrático (~5-9 s cada)."""
+    return [
+        ('li_com_p_sem_fecho', '<li><p>a</p> x' * 4000),
+        ('li_sem_fecho_com_hifen', '<li>a - b ' * 8000),
+        ('espacos_antes_de_hifen', '<li>a' + ' ' * 40000 + '- </li>'),
+        ('item_em_paragrafo_longo', '<p>- ' + 'x</p>' * 20000),
+        ('aninhamento_profundo', '<ul><li><p>a</p>' * 3000 + '</li></ul>' * 3000),
+        ('p_sem_fecho_em_li', '<ul>\n' + '<li>\n<p>texto - Outro\n' * 5000 + '</ul>'),
+    ]
+
+
+def executar_stress(orcamento: float) -> int:
+    formatador = FormatadorHtml()
+    excedidos = 0
+    print(f'{"Caso":<26} {"KB":>7} {"tempo (ms)":>11}')
+    for nome, html in gerar_html_adversarial():
+        inicio = time.perf_counter()
+        formatador.limpeza_final(html, nome)
+        segundos = time.perf_counter() - inicio
+        estado = '' if segundos <= orcamento else '  EXCEDEU ORÇAMENTO'
+        excedidos += segundos > orcamento
+        print(f'{nome:<26} {len(html) / 1024:>7.0f} {segundos * 1000:>11.2f}{estado}')
+    if excedidos:
+        print(f'{excedidos} caso(s) acima de {orcamento:.2f} s')
+        return 1
+    print(f'Todos os casos abaixo de {orcamento:.2f} s')
+    return 0
+
+
+def executar_regressao(atualizar: bool = False) -> int:
+    casos = json.loads(ARQUIVO_REGRESSAO_LIMPEZA.read_text(encoding='utf-8'))
+    formatador = FormatadorHtml()
+    diferentes = 0
+    for caso in casos:
+        saida = formatador.limpeza_final(caso['entrada'], 'regressao')
+        if saida == caso['esperado']:
+            continue
+        if atualizar:
+            caso['esperado'] = saida
+            print(f"Atualizado: {caso['nome']}")
+            continue
+        diferentes += 1
+        print(f"DIFERENTE [{caso['categoria']}] {caso['nome']}")
+        print(f"  esperado: {caso['esperado']!r}")
+        print(f"  obtido:   {saida!r}")
+    if atualizar:
+        ARQUIVO_REGRESSAO_LIMPEZA.write_text(json.dumps(casos, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+        print(f'Saídas esperadas regravadas em: {ARQUIVO_REGRESSAO_LIMPEZA}')
+        return 0
+    if diferentes:
+        print(f'{diferentes} de {len(casos)} caso(s) com saída diferente')
+        return 1
+    print(f'Todos os {len(casos)} casos de regressão com a saída esperada')
+    return 0
+
+
+def medir_arranque_comando(argumentos: list[str]) -> dict:
+    """Executa o comando com -X importtime e resume a saída (microssegundos)."""
+    inicio = time.perf_counter()
+    processo = subprocess.run([sys.executable, '-X', 'importtime', *argumentos], cwd=DIRETORIO_SCRIPTS,
+                              capture_output=True, text=True)
+    segundos = time.perf_counter() - inicio
+    modulos = {}
+    total_us = 0
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith('import time:') or 'imported package' in linha:
+            continue
+        _, proprio, cumulativo, nome = (parte.strip() for parte in linha.replace('import time:', '|', 1).split('|'))
+        modulos[nome] = int(cumulativo)
+        # Só as entradas de topo (sem indentação) somam para o total, o resto já está incluído nelas
+        if not linha.rsplit('|', 1)[1].startswith('  '):
+            total_us += int(cumulativo)
+    return {'segundos': segundos, 'import_us': total_us, 'modulos': modulos, 'codigo_saida': processo.returncode}
+
+
+def executar_arranque(repeticoes: int) -> int:
+    falhas = 0
+    print(f'{"Comando":<30} {"wall (ms)":>10} {"imports (ms)":>13}  mais pesados')
+    for nome, argumentos in COMANDOS_ARRANQUE:
+        medidas = [medir_arranque_comando(argumentos) for _ in range(repeticoes)]
+        melhor = min(medidas, key=lambda m: m['segundos'])
+        pesados = sorted(melhor['modulos'].items(), key=lambda item: item[1], reverse=True)
+        pesados = [f'{modulo} {us / 1000:.1f}' for modulo, us in pesados if modulo != 'data_github_projects'][:3]
+        print(f"{nome:<30} {melhor['segundos'] * 1000:>10.1f} {melhor['import_us'] / 1000:>13.1f}  {', '.join(pesados)}")
+        proibidos = [m for m in MODULOS_PROIBIDOS_OFFLINE if m in melhor['modulos']]
+        if proibidos or melhor['codigo_saida'] != 0:
+            falhas += 1
+            motivo = f"importou {', '.join(proibidos)}" if proibidos else f"código de saída {melhor['codigo_saida']}"
+            print(f'  FALHA: {motivo}')
+    return 1 if falhas else 0
+
+
+class _ServidorGithubFalso(BaseHTTPRequestHandler):
+    """Serve, por caminho (/<índice do cenário>), as respostas programadas em CENARIOS_HTTP."""
+    respostas: dict[str, list] = {}
+    contagem: dict[str, int] = {}
+    trava = threading.Lock()
+
+    def do_GET(self):
+        with self.trava:
+            self.contagem[self.path] = self.contagem.get(self.path, 0) + 1
+            fila = self.respostas.get(self.path) or [(200, None, None)]
+            status, reset, retry_after = fila.pop(0) if len(fila) > 1 else fila[0]
+        corpo = b'{}' if status == 200 else b'{"message": "API rate limit exceeded"}'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(corpo)))
+        self.send_header('X-RateLimit-Resource', 'core')
+        self.send_header('X-RateLimit-Limit', '60')
+        self.send_header('X-RateLimit-Remaining', '0' if reset is not None else '59')
+        self.send_header('X-RateLimit-Reset', str(time.time() + (reset or 3600.0)))
+        if retry_after:
+            self.send_header('Retry-After', retry_after)
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ServidorGraphqlFalso(BaseHTTPRequestHandler):
+    """GraphQL (POST /graphql) e REST/raw (GET, ver _AdaptadorServidorLocal) de um mundo fictício de repositórios."""
+    requisicoes: list[tuple[str, str]] = []
+    trava = threading.Lock()
+
+    @staticmethod
+    def _readme(repositorio: str) -> str:
+        return f'# Projeto {repositorio}\n\nDescrição do projeto {repositorio}.\n'
+
+    def _responder(self, status: int, corpo: str, tipo: str = 'application/json'):
+        dados = corpo.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', tipo)
+        self.send_header('Content-Length', str(len(dados)))
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def do_POST(self):
+        variaveis = json.loads(self.rfile.read(int(self.headers['Content-Length'])))['variables']
+        donos = {variaveis[f'dono{i}'] for i in range(len(variaveis) // 2)}
+        with self.trava:
+            self.requisicoes.append(('POST', '/'.join(sorted(donos))))
+        if 'falha5xx' in donos:
+            self._responder(502, '{"message": "Bad Gateway"}')
+            return
+        dados = {}
+        for i in range(len(variaveis) // 2):
+            nome = variaveis[f'nome{i}']
+            if nome == 'apagado':
+                dados[f'r{i}'] = None
+                continue
+            dados[f'r{i}'] = {
+                'description': f'desc {nome}', 'pushedAt': '2024-01-01T00:00:00Z',
+                'defaultBranchRef': {'name': 'main'},
+                'readme0': None if nome == 'semreadme' else {'text': self._readme(nome)},
+            }
+        self._responder(200, json.dumps({'data': dados}))
+
+    def do_GET(self):
+        # /repos/{dono}/{repo}[/readme] (REST) ou /raw/{dono}/{repo}/{branch}/{ficheiro}
+        tipo, dono, nome, *resto = [parte for parte in self.path.split('?')[0].split('/') if parte] + ['', '']
+        with self.trava:
+            self.requisicoes.append(('GET', dono))
+        if tipo == 'raw' or nome == 'apagado':
+            self._responder(404, '{"message": "Not Found"}')
+        elif resto[0] == 'readme':
+            self._responder(200, self._readme(nome), 'text/plain; charset=utf-8')
+        else:
+            self._responder(200, json.dumps({'description': f'desc {nome}', 'default_branch': 'main',
+                                             'pushed_at': '2024-01-01T00:00:00Z'}))
+
+    def log_message(self, *args):
+        pass
+
+
+def _montar_adaptador_servidor_local(base: str):
+    """Adaptador do requests que reencaminha api.github.com e raw.githubusercontent.com para `base`."""
+    from requests.adapters import HTTPAdapter
+
+    class _AdaptadorServidorLocal(HTTPAdapter):
+        def send(self, request, **kwargs):
+            request.url = (request.url.replace('https://api.github.com', base)
+                           .replace('https://raw.githubusercontent.com', f'{base}/raw'))
+            return super().send(request, **kwargs)
+    return _AdaptadorServidorLocal()
+
+
+def executar_graphql() -> int:
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), _ServidorGraphqlFalso)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{servidor.server_port}'
+    falhas = 0
+    print(f'\n{"Cenário GraphQL":<20} {"POSTs":>7} {"GETs REST":>10}  itens')
+    try:
+        for nome, repositorios, posts_esperados, gets_esperados, titulos_esperados in CENARIOS_GRAPHQL:
+            gerente = GerenciadorDeRepositorios(backend='graphql')
+            gerente.cliente_github = ClienteGithub('token-de-teste', limitador=LimitadorDeTaxa(0),
+                                                   url_graphql=f'{base}/graphql', metricas=gerente.metricas)
+            gerente.cliente_github.sessao.trust_env = False
+            gerente.cliente_github.sessao.mount('https://', _montar_adaptador_servidor_local(base))
+            _ServidorGraphqlFalso.requisicoes.clear()
+            random.seed(SEMENTE_HTTP)
+            with contextlib.redirect_stdout(io.StringIO()):
+                itens = gerente.buscar_todos([f'https://github.com/{r}' for r in repositorios])
+            dono = repositorios[0].split('/')[0]
+            posts = sum(1 for metodo, _ in _ServidorGraphqlFalso.requisicoes if metodo == 'POST')
+            gets = sum(1 for metodo, alvo in _ServidorGraphqlFalso.requisicoes if metodo == 'GET' and alvo == dono)
+            titulos = {item['repo']: item.get('title') if 'description_html' in item else None for item in itens}
+            erro = posts != posts_esperados or gets != gets_esperados or titulos != titulos_esperados
+            falhas += erro
+            resumo = ', '.join(f'{repo}={titulo!r}' for repo, titulo in titulos.items())
+            print(f"{nome:<20} {posts:>3} / {posts_esperados:<1} {gets:>5} / {gets_esperados:<2}  {resumo}"
+                  f"{'  FALHA' if erro else ''}")
+            if titulos != titulos_esperados:
+                print(f'  esperado: {titulos_esperados}')
+    finally:
+        servidor.shutdown()
+    return falhas
+
+
+def esperar_backoff_semeado(tentativas: int) -> float:
+    """Soma dos backoffs com jitter que o cliente vai sortear com a SEMENTE_HTTP."""
+    random.seed(SEMENTE_HTTP)
+    return sum(random.uniform(0, BACKOFF_TESTE_HTTP_SEGUNDOS * (2 ** t)) for t in range(tentativas))
+
+
+def executar_http() -> int:
+    import requests
+    data_github_projects.BASE_BACKOFF_SEGUNDOS = BACKOFF_TESTE_HTTP_SEGUNDOS
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), _ServidorGithubFalso)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    falhas = 0
+    print(f'{"Cenário":<20} {"requisições":>11} {"resultado":>10} {"tempo (s)":>10} {"mínimo (s)":>11}')
+    try:
+        for indice, (nome, respostas, esperadas, sucesso_esperado, espera_minima) in enumerate(CENARIOS_HTTP):
+            caminho = f'/{indice}'
+            _ServidorGithubFalso.respostas[caminho] = list(respostas)
+            if espera_minima is None:
+                espera_minima = esperar_backoff_semeado(esperadas - 1)
+            random.seed(SEMENTE_HTTP)
+            cliente = ClienteGithub(limitador=LimitadorDeTaxa(0))
+            cliente.sessao.trust_env = False
+            inicio = time.perf_counter()
+            try:
+                sucesso = cliente._requisitar('GET', f'http://127.0.0.1:{servidor.server_port}{caminho}').status_code == 200
+            except requests.HTTPError:
+                sucesso = False
+            segundos = time.perf_counter() - inicio
+            feitas = _ServidorGithubFalso.contagem.get(caminho, 0)
+            erro = (feitas != esperadas or sucesso != sucesso_esperado or segundos < espera_minima * 0.95)
+            falhas += erro
+            print(f"{nome:<20} {feitas:>5} / {esperadas:<3} {'200' if sucesso else 'erro':>10} "
+                  f"{segundos:>10.2f} {espera_minima:>11.2f}{'  FALHA' if erro else ''}")
+    finally:
+        servidor.shutdown()
+    falhas += executar_graphql()
+    if falhas:
+        print(f'{falhas} cenário(s) fora do esperado')
+        return 1
+    print('Todos os cenários HTTP conforme o esperado')
+    return 0
+
+
+def carregar_readmes_do_cache() -> list[tuple[str, str]]:
+    documentos = []
+    if not DIRETORIO_CACHE_HTTP.exists():
+        return documentos
+    for arquivo in sorted(DIRETORIO_CACHE_HTTP.glob('*.json')):
+        try:
+            entrada = json.loads(arquivo.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            continue
+        url = entrada.get('url', '')
+        if url.endswith('/readme') or '/README' in url.upper():
+            documentos.append((f'cache:{url}', entrada.get('corpo') or ''))
+    return documentos
+
+
+def montar_corpus(diretorio_extra: Path | None) -> list[tuple[str, str]]:
+    readme_local = (DIRETORIO_RAIZ / 'README.md').read_text(encoding='utf-8')
+    corpus = [('local:README.md', readme_local)]
+    corpus += carregar_readmes_do_cache()
+    if diretorio_extra:
+        corpus += [(f'extra:{a.name}', a.read_text(encoding='utf-8', errors='replace'))
+                   for a in sorted(diretorio_extra.rglob('*.md'))]
+    corpus += gerar_documentos_sinteticos(readme_local)
+    return corpus
+
+
+def executar_pipeline(corpus, dados_existentes, medir_tempo: bool) -> dict[str, float]:
+    """Executa uma passagem completa e devolve o tempo acumulado por etapa."""
+    processador = ProcessadorMarkdown()
+    conversor = ConversorMarkdownHtml()  # sem memo: cada conversão é trabalho real
+    formatador = FormatadorHtml()
+    tempos = dict.fromkeys(ETAPAS, 0.0)
+    relogio = time.perf_counter if medir_tempo else (lambda: 0.0)
+
+    for nome, texto in corpus:
+        t0 = relogio()
+        _, corpo = processador.extrair_titulo_e_corpo(texto)
+        t1 = relogio()
+        corpo = processador.limpar_corpo_bruto(corpo)
+        t2 = relogio()
+        html = conversor.converter(corpo)
+        t3 = relogio()
+        formatador.limpeza_final(html, nome)
+        t4 = relogio()
+        tempos['extrair_titulo_e_corpo'] += t1 - t0
+        tempos['limpar_corpo_bruto'] += t2 - t1
+        tempos['converter'] += t3 - t2
+        tempos['limpeza_final'] += t4 - t3
+
+    t0 = relogio()
+    for item in dados_existentes:
+        formatador.limpeza_final(item.get('description_html'), item.get('repo', ''))
+    tempos['reaplicar_limpeza'] += relogio() - t0
+    return tempos
+
+
+def medir(corpus, dados_existentes, repeticoes: int) -> dict:
+    melhores = None
+    for _ in range(repeticoes):
+        tempos = executar_pipeline(corpus, dados_existentes, medir_tempo=True)
+        melhores = tempos if melhores is None else {k: min(melhores[k], tempos[k]) for k in ETAPAS}
+
+    tracemalloc.start()
+    executar_pipeline(corpus, dados_existentes, medir_tempo=False)
+    _, pico_memoria = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    bytes_md = sum(len(texto.encode('utf-8')) for _, texto in corpus)
+    bytes_html = sum(len((item.get('description_html') or '').encode('utf-8')) for item in dados_existentes)
+    etapas = {}
+    for etapa in ETAPAS:
+        documentos = len(dados_existentes) if etapa == 'reaplicar_limpeza' else len(corpus)
+        volume = bytes_html if etapa == 'reaplicar_limpeza' else bytes_md
+        segundos = melhores[etapa]
+        etapas[etapa] = {
+            'segundos': segundos,
+            'documentos_por_segundo': documentos / segundos if segundos else 0.0,
+            'mb_por_segundo': volume / 1e6 / segundos if segundos else 0.0,
+        }
+    return {
+        'documentos': len(corpus),
+        'bytes_markdown': bytes_md,
+        'documentos_reaplicar': len(dados_existentes),
+        'pico_memoria_bytes': pico_memoria,
+        'etapas': etapas,
+    }
+
+
+def imprimir_resultado(resultado: dict, baseline: dict | None):
+    print(f"Corpus: {resultado['documentos']} READMEs ({resultado['bytes_markdown'] / 1e6:.2f} MB), "
+          f"{resultado['documentos_reaplicar']} itens para re-higienizar")
+    print(f'{"Etapa":<24} {"tempo (ms)":>11} {"docs/s":>10} {"MB/s":>8} {"vs baseline":>12}')
+    for etapa, medida in resultado['etapas'].items():
+        comparacao = ''
+        if baseline and etapa in baseline.get('etapas', {}):
+            anterior = baseline['etapas'][etapa]['segundos']
+            if anterior:
+                comparacao = f"{(medida['segundos'] - anterior) / anterior * 100:+.1f}%"
+        print(f"{etapa:<24} {medida['segundos'] * 1000:>11.2f} {medida['documentos_por_segundo']:>10.1f} "
+              f"{medida['mb_por_segundo']:>8.2f} {comparacao:>12}")
+    pico = resultado['pico_memoria_bytes'] / 1e6
+    if baseline:
+        print(f"Pico de memória: {pico:.2f} MB (baseline: {baseline['pico_memoria_bytes'] / 1e6:.2f} MB)")
+    else:
+        print(f'Pico de memória: {pico:.2f} MB')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark offline do pipeline README → HTML.')
+    parser.add_argument('--repeticoes', type=int, default=5, help='Repetições por medição (usa o melhor tempo).')
+    parser.add_argument('--corpus', type=Path, help='Diretório com ficheiros .md adicionais.')
+    parser.add_argument('--salvar-baseline', type=Path, help='Guarda o resultado em JSON.')
+    parser.add_argument('--comparar', type=Path, help='Compara com uma baseline guardada anteriormente.')
+    parser.add_argument('--stress', action='store_true', help='Só corre as entradas HTML adversariais com orçamento de tempo.')
+    parser.add_argument('--arranque', action='store_true',
+                        help='Mede o arranque dos comandos offline com -X importtime.')
+    parser.add_argument('--regressao', action='store_true',
+                        help='Compara limpeza_final com as saídas esperadas do corpus de regressão.')
+    parser.add_argument('--atualizar-regressao', action='store_true',
+                        help='Com --regressao: regrava as saídas esperadas com as atuais.')
+    parser.add_argument('--http', action='store_true',
+                        help='Verifica retentativas e rate limit do cliente contra um servidor HTTP falso local.')
+    parser.add_argument('--orcamento', type=float, default=ORCAMENTO_STRESS_SEGUNDOS,
+                        help=f'Tempo máximo por caso no modo --stress (padrão: {ORCAMENTO_STRESS_SEGUNDOS} s).')
+    args = parser.parse_args()
+
+    if args.stress:
+        return executar_stress(args.orcamento)
+    if args.regressao:
+        return executar_regressao(args.atualizar_regressao)
+    if args.arranque:
+        return executar_arranque(max(1, args.repeticoes))
+    if args.http:
+        return executar_http()
+
+    corpus = montar_corpus(args.corpus)
+    resultado = medir(corpus, carregar_dados_json(), max(1, args.repeticoes))
+
+    baseline = None
+    if args.comparar:
+        baseline = json.loads(args.comparar.read_text(encoding='utf-8'))
+    imprimir_resultado(resultado, baseline)
+
+    if args.salvar_baseline:
+        args.salvar_baseline.write_text(json.dumps(resultado, indent=2), encoding='utf-8')
+        print(f'Baseline salva em: {args.salvar_baseline}')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
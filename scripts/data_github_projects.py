@@ -1,21 +1,121 @@
+from __future__ import annotations
+
 import os
 import re
+import sys
+import gzip
 import json
 import time
+import random
+import hashlib
+import difflib
+import filecmp
 import argparse
-import requests
-import markdown
-from typing import Optional
+import threading
+import itertools
+import contextlib
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 from pathlib import Path
+from html import unescape
 from urllib.parse import urlparse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# requests e markdown só são importados quando há trabalho de rede/conversão: os comandos
+# offline (limpar, validar) arrancam sem carregar essas bibliotecas
+if TYPE_CHECKING:
+    import requests
+    import markdown
 
 DIRETORIO_RAIZ = Path(__file__).resolve().parent.parent
 DIRETORIO_SAIDA = DIRETORIO_RAIZ / 'data'
 ARQUIVO_SAIDA = DIRETORIO_SAIDA / 'github_projects.json'
-
-TEMPO_PAUSA_ENTRE_REQUISICOES = 1.0
+ARQUIVO_MANIFESTO = DIRETORIO_SAIDA / 'github_projects.manifest.json'
+# Saída fragmentada: índice leve + um ficheiro HTML por projeto (nome inclui hash do conteúdo)
+ARQUIVO_INDICE = DIRETORIO_SAIDA / 'github_projects.index.json'
+DIRETORIO_HTML_PROJETOS = DIRETORIO_SAIDA / 'projetos'
+GERAR_SAIDA_FRAGMENTADA = True
+# Sem 'description' do GitHub, o índice leva um excerto em texto plano do README (limite do card no script.js)
+TAMANHO_EXCERTO_INDICE = 200
+# Gera irmãos pré-comprimidos (.gz e, se o pacote 'brotli' estiver instalado, .br) dos artefatos publicados
+GERAR_ARTEFATOS_COMPRIMIDOS = True
+DIRETORIO_CACHE_HTTP = DIRETORIO_RAIZ / '.cache' / 'http'
+ARQUIVO_CACHE_NEGATIVO_README = DIRETORIO_RAIZ / '.cache' / 'readme_inexistentes.json'
+# Relatório de instrumentação da última execução (uma linha JSON por repositório + resumo)
+ARQUIVO_METRICAS = DIRETORIO_RAIZ / '.cache' / 'metricas.jsonl'
+# Exportações compactas para consumidores externos (subcomando exportar)
+ARQUIVO_EXPORTACAO_COLUNAR = DIRETORIO_SAIDA / 'github_projects.columnar.json'
+ARQUIVO_EXPORTACAO_MSGPACK = DIRETORIO_SAIDA / 'github_projects.msgpack'
+
+# Esquema (subconjunto de JSON Schema) de cada item do catálogo; verificado antes de
+# substituir o ficheiro e pelo subcomando validar
+ESQUEMA_ITEM_CATALOGO = {
+    'type': 'object',
+    'required': ['repo', 'link'],
+    'additionalProperties': False,
+    'properties': {
+        'repo': {'type': 'string', 'minLength': 1},
+        'link': {'type': 'string', 'pattern': r'^https://github\.com/[^/\s]+/[^/\s]+$'},
+        'description': {'type': 'string'},
+        'title': {'type': 'string'},
+        'description_html': {'type': 'string'},
+    },
+}
+# O índice da saída fragmentada troca description_html por html_file
+ESQUEMA_ITEM_INDICE = {
+    **ESQUEMA_ITEM_CATALOGO,
+    'properties': {
+        **{campo: regra for campo, regra in ESQUEMA_ITEM_CATALOGO['properties'].items() if campo != 'description_html'},
+        'html_file': {'type': 'string', 'pattern': r'^projetos/[^/]+\.html$'},
+        'excerpt': {'type': 'string', 'minLength': 1},
+    },
+}
+
+# Tamanho máximo do cache HTTP em disco; entradas menos usadas são removidas primeiro
+TAMANHO_MAXIMO_CACHE_BYTES = 50 * 1024 * 1024
+# Candidatos raw de README (branch × nome de ficheiro) testados em paralelo por repositório
+MAXIMO_SONDAGENS_README_PARALELAS = 8
+# Por quanto tempo um README inexistente (404) é lembrado antes de voltar a ser testado
+VALIDADE_CACHE_NEGATIVO_SEGUNDOS = 7 * 24 * 3600
+# Tamanho do pool de conexões keep-alive da sessão HTTP
+TAMANHO_POOL_CONEXOES = 32
+# Quantidade de conversões Markdown→HTML memorizadas em memória (0 desativa)
+TAMANHO_MEMO_CONVERSAO = 256
+
+# Limite global de requisições HTTP por segundo (partilhado por todas as threads)
+REQUISICOES_POR_SEGUNDO = 4.0
+# Com GITHUB_TOKEN (5000 req/h) o ritmo base é bem maior; o orçamento restante o ajusta
+REQUISICOES_POR_SEGUNDO_AUTENTICADO = 20.0
+# Abaixo desta fração do limite (X-RateLimit-Limit) o ritmo passa a distribuir o restante até ao reset
+FRACAO_RESERVA_RATE_LIMIT = 0.1
+# Espera máxima aceitável (s) por um reset/Retry-After; acima disso a requisição falha logo (e usa fallback)
+MAXIMO_ESPERA_RATE_LIMIT = 60.0
+# Retentativas para 5xx, 429, limite secundário e erros de rede (backoff exponencial com jitter)
+MAXIMO_RETENTATIVAS = 4
+BASE_BACKOFF_SEGUNDOS = 1.0
+STATUS_RETENTAVEIS = {500, 502, 503, 504, 429}
+# Itens enviados de uma vez a cada processo na re-higienização em lote (--processos)
+TAMANHO_LOTE_PROCESSOS = 16
+# Intervalo entre ciclos do modo contínuo (--continuo)
+INTERVALO_MODO_CONTINUO_SEGUNDOS = 300.0
+# Número máximo de repositórios processados em simultâneo
+MAXIMO_REPOSITORIOS_EM_VOO = 8
 TOKEN_GITHUB = os.environ.get('GITHUB_TOKEN')
 
+URL_API_GRAPHQL = 'https://api.github.com/graphql'
+# Backend de busca: 'graphql' (em lotes, exige token) ou 'rest' (um repositório por vez)
+BACKEND_PADRAO = os.environ.get('BACKEND_GITHUB', 'graphql' if TOKEN_GITHUB else 'rest')
+# Quantidade de repositórios consultados por cada query GraphQL
+TAMANHO_LOTE_GRAPHQL = 25
+# Nomes de README tentados via GraphQL (HEAD:<nome>), na ordem de preferência
+NOMES_README_GRAPHQL = ['README.md', 'README.MD', 'Readme.md', 'readme.md', 'README.markdown', 'README']
+
+# Ficheiro opcional de fontes (URLs explícitas e/ou utilizadores/organizações); ver DescobridorDeRepositorios
+ARQUIVO_CONFIGURACAO_FONTES = Path(__file__).resolve().parent / 'repositorios.json'
+# Repositórios por página ao enumerar /users/{u}/repos (máximo permitido pela API)
+REPOSITORIOS_POR_PAGINA = 100
+
+# Fontes usadas quando não há configuração nem argumentos de linha de comandos
 LISTA_URLS_REPOSITORIOS = [
     'https://github.com/Tiago-Daniel-Guerreiro/IpShared',
     'https://github.com/Tiago-Daniel-Guerreiro/AppDeQuiosque',
@@ -26,37 +126,551 @@ LISTA_URLS_REPOSITORIOS = [
     'https://github.com/Tiago-Daniel-Guerreiro/SistemaDeGestaoDeBiblioteca',
 ]
 
+def imprimir_linha(mensagem: str):
+    """
+    Escreve a mensagem e a quebra de linha numa única chamada: com vários repositórios em
+    paralelo, um print normal (texto e '\\n' em duas escritas) pode colar linhas de threads diferentes.
+    """
+    print(f'{mensagem}\n', end='')
+
+
+class LimitadorDeTaxa:
+    """
+    Limitador global de taxa de requisições, seguro entre threads.
+    Garante um intervalo mínimo entre o início de duas requisições consecutivas.
+    """
+    def __init__(self, requisicoes_por_segundo: float):
+        self.intervalo_minimo = 1.0 / requisicoes_por_segundo if requisicoes_por_segundo > 0 else 0.0
+        self._trava = threading.Lock()
+        self._proximo_horario_livre = 0.0
+
+    def definir_intervalo(self, intervalo_segundos: float):
+        with self._trava:
+            self.intervalo_minimo = max(0.0, intervalo_segundos)
+
+    def pausar_por(self, segundos: float):
+        """Nenhuma thread inicia nova requisição nos próximos `segundos` (ex.: Retry-After)."""
+        with self._trava:
+            self._proximo_horario_livre = max(self._proximo_horario_livre, time.monotonic() + segundos)
+
+    def aguardar_vez(self):
+        """Bloqueia a thread atual até que a próxima requisição seja permitida."""
+        with self._trava:
+            agora = time.monotonic()
+            horario_reservado = max(agora, self._proximo_horario_livre)
+            self._proximo_horario_livre = horario_reservado + self.intervalo_minimo
+        espera = horario_reservado - agora
+        if espera > 0:
+            time.sleep(espera)
+
+
+class CacheHttp:
+    """
+    Cache HTTP persistente em disco para requisições condicionais.
+    Guarda, por URL (e cabeçalho Accept), o corpo da resposta junto com ETag/Last-Modified.
+    Cada entrada é um ficheiro JSON; ao exceder o tamanho máximo, remove as menos usadas (LRU).
+    """
+    def __init__(self, diretorio: Path, tamanho_maximo_bytes: int = TAMANHO_MAXIMO_CACHE_BYTES):
+        self.diretorio = diretorio
+        self.tamanho_maximo_bytes = tamanho_maximo_bytes
+        self._trava = threading.Lock()
+        self._indice: OrderedDict[str, int] | None = None
+
+    @staticmethod
+    def _chave(url: str, accept: str) -> str:
+        return hashlib.sha256(f'{accept}\n{url}'.encode('utf-8')).hexdigest()
+
+    def _carregar_indice(self) -> OrderedDict[str, int]:
+        """Lê os tamanhos das entradas existentes, da menos para a mais recentemente usada."""
+        if self._indice is None:
+            self._indice = OrderedDict()
+            if self.diretorio.exists():
+                arquivos = sorted(self.diretorio.glob('*.json'), key=lambda a: a.stat().st_mtime)
+                for arquivo in arquivos:
+                    self._indice[arquivo.stem] = arquivo.stat().st_size
+        return self._indice
+
+    def obter(self, url: str, accept: str) -> dict | None:
+        chave = self._chave(url, accept)
+        arquivo = self.diretorio / f'{chave}.json'
+        with self._trava:
+            indice = self._carregar_indice()
+            if chave not in indice:
+                return None
+            try:
+                entrada = json.loads(arquivo.read_text(encoding='utf-8'))
+            except (OSError, json.JSONDecodeError):
+                indice.pop(chave, None)
+                return None
+            indice.move_to_end(chave)
+            try:
+                os.utime(arquivo)
+            except OSError:
+                pass
+        return entrada
+
+    def guardar(self, url: str, accept: str, etag: str | None, last_modified: str | None, corpo: str):
+        chave = self._chave(url, accept)
+        conteudo = json.dumps({
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'corpo': corpo,
+        }, ensure_ascii=False)
+        with self._trava:
+            indice = self._carregar_indice()
+            self.diretorio.mkdir(parents=True, exist_ok=True)
+            arquivo = self.diretorio / f'{chave}.json'
+            temporario = arquivo.with_suffix(f'.{threading.get_ident()}.tmp')
+            temporario.write_text(conteudo, encoding='utf-8')
+            os.replace(temporario, arquivo)
+            indice[chave] = arquivo.stat().st_size
+            indice.move_to_end(chave)
+            self._remover_excedente(indice)
+
+    def _remover_excedente(self, indice: OrderedDict[str, int]):
+        total = sum(indice.values())
+        while total > self.tamanho_maximo_bytes and len(indice) > 1:
+            chave_antiga, tamanho = indice.popitem(last=False)
+            total -= tamanho
+            try:
+                (self.diretorio / f'{chave_antiga}.json').unlink()
+            except OSError:
+                pass
+
+
+class CacheNegativoReadme:
+    """
+    Lembra quais combinações (dono/repositorio, branch, ficheiro) responderam 404,
+    para não voltar a sondá-las até a entrada expirar. Persistido em JSON.
+    """
+    def __init__(self, arquivo: Path, validade_segundos: float = VALIDADE_CACHE_NEGATIVO_SEGUNDOS):
+        self.arquivo = arquivo
+        self.validade_segundos = validade_segundos
+        self._trava = threading.Lock()
+        self._alterado = False
+        self._entradas: dict[str, float] = {}
+        if arquivo.exists():
+            try:
+                self._entradas = json.loads(arquivo.read_text(encoding='utf-8'))
+            except (OSError, json.JSONDecodeError):
+                self._entradas = {}
+
+    @staticmethod
+    def _chave(dono: str, repositorio: str, branch: str, nome: str) -> str:
+        return f'{dono}/{repositorio}/{branch}/{nome}'
+
+    def sabe_que_nao_existe(self, dono: str, repositorio: str, branch: str, nome: str) -> bool:
+        registrado_em = self._entradas.get(self._chave(dono, repositorio, branch, nome))
+        return registrado_em is not None and time.time() - registrado_em < self.validade_segundos
+
+    def registrar_inexistente(self, dono: str, repositorio: str, branch: str, nome: str):
+        with self._trava:
+            self._entradas[self._chave(dono, repositorio, branch, nome)] = time.time()
+            self._alterado = True
+
+    def salvar(self):
+        with self._trava:
+            if not self._alterado:
+                return
+            agora = time.time()
+            validas = {k: v for k, v in self._entradas.items() if agora - v < self.validade_segundos}
+            self.arquivo.parent.mkdir(parents=True, exist_ok=True)
+            self.arquivo.write_text(json.dumps(validas, indent=2, sort_keys=True), encoding='utf-8')
+            self._alterado = False
+
+
+class MetricasExecucao:
+    """
+    Instrumentação estruturada de uma execução.
+    Cada thread regista as medições no repositório que está a processar (via threading.local);
+    medições feitas fora de um repositório (ex.: lotes GraphQL) vão para o registo 'global'.
+    """
+    def __init__(self):
+        self._local = threading.local()
+        self._trava = threading.Lock()
+        self.inicio = time.time()
+        self.registos: list[dict] = []
+        self.registo_global = self._novo_registo('global')
+
+    @staticmethod
+    def _novo_registo(repositorio: str) -> dict:
+        return {
+            'repositorio': repositorio,
+            'etapas': {},
+            'requisicoes_http': 0,
+            'bytes_baixados': 0,
+            'acertos_cache': 0,
+            'sondagens_fallback': 0,
+            'rate_limit_restante': None,
+            'reaproveitado': False,
+        }
+
+    def _registo_atual(self) -> dict:
+        return getattr(self._local, 'registo', None) or self.registo_global
+
+    @contextlib.contextmanager
+    def repositorio(self, nome: str):
+        """Associa as medições da thread atual a um repositório durante o bloco."""
+        registo = self._novo_registo(nome)
+        self._local.registo = registo
+        inicio = time.perf_counter()
+        try:
+            yield registo
+        finally:
+            registo['tempo_total'] = time.perf_counter() - inicio
+            self._local.registo = None
+            with self._trava:
+                self.registos.append(registo)
+
+    def vincular_registo_atual(self, funcao):
+        """
+        Embrulha `funcao` para registar no repositório da thread que a chama agora, mesmo que
+        seja executada noutra thread (ex.: sondagens submetidas a um pool interno).
+        """
+        registo = getattr(self._local, 'registo', None)
+
+        def _executar(*args, **kwargs):
+            anterior = getattr(self._local, 'registo', None)
+            self._local.registo = registo
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                self._local.registo = anterior
+        return _executar
+
+    @contextlib.contextmanager
+    def medir_etapa(self, etapa: str):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            etapas = self._registo_atual()['etapas']
+            etapas[etapa] = etapas.get(etapa, 0.0) + time.perf_counter() - inicio
+
+    def registrar_http(self, bytes_baixados: int, acerto_cache: bool, rate_limit_restante: str | None):
+        registo = self._registo_atual()
+        with self._trava:
+            registo['requisicoes_http'] += 1
+            registo['bytes_baixados'] += bytes_baixados
+            registo['acertos_cache'] += int(acerto_cache)
+            if rate_limit_restante is not None:
+                registo['rate_limit_restante'] = int(rate_limit_restante)
+
+    def registrar_sondagem_fallback(self):
+        registo = self._registo_atual()
+        with self._trava:
+            registo['sondagens_fallback'] += 1
+
+    def resumo(self) -> dict:
+        todos = self.registos + [self.registo_global]
+        limites = [r['rate_limit_restante'] for r in todos if r['rate_limit_restante'] is not None]
+        mais_lentos = sorted(self.registos, key=lambda r: r.get('tempo_total', 0.0), reverse=True)[:5]
+        return {
+            'tipo': 'resumo',
+            'inicio': self.inicio,
+            'duracao': time.time() - self.inicio,
+            'repositorios': len(self.registos),
+            'reaproveitados': sum(r['reaproveitado'] for r in self.registos),
+            'requisicoes_http': sum(r['requisicoes_http'] for r in todos),
+            'bytes_baixados': sum(r['bytes_baixados'] for r in todos),
+            'acertos_cache': sum(r['acertos_cache'] for r in todos),
+            'sondagens_fallback': sum(r['sondagens_fallback'] for r in todos),
+            'rate_limit_restante_minimo': min(limites) if limites else None,
+            'mais_lentos': [(r['repositorio'], round(r.get('tempo_total', 0.0), 3)) for r in mais_lentos],
+        }
+
+    def salvar_relatorio(self, arquivo: Path = ARQUIVO_METRICAS) -> dict:
+        """Escreve uma linha JSON por repositório, a linha 'global' e o resumo no fim."""
+        resumo = self.resumo()
+        arquivo.parent.mkdir(parents=True, exist_ok=True)
+        with open(arquivo, 'w', encoding='utf-8') as f:
+            for registo in self.registos + [self.registo_global]:
+                f.write(json.dumps({'tipo': 'repositorio', **registo}, ensure_ascii=False) + '\n')
+            f.write(json.dumps(resumo, ensure_ascii=False) + '\n')
+        return resumo
+
+    def imprimir_resumo(self, resumo: dict):
+        print(f"Resumo: {resumo['repositorios']} repositórios em {resumo['duracao']:.1f}s "
+              f"({resumo['reaproveitados']} reaproveitados), {resumo['requisicoes_http']} requisições HTTP, "
+              f"{resumo['bytes_baixados'] / 1024:.1f} KiB baixados, {resumo['acertos_cache']} acertos de cache, "
+              f"{resumo['sondagens_fallback']} sondagens de fallback, "
+              f"rate limit restante: {resumo['rate_limit_restante_minimo']}")
+        for nome, segundos in resumo['mais_lentos']:
+            print(f'  {nome}: {segundos:.2f}s')
+
+
 class ClienteGithub:
     """
     Responsável por realizar chamadas HTTP à API do GitHub ou a URLs raw.
     Gerencia cabeçalhos de autenticação e sessões.
     """
-    def __init__(self, token: Optional[str] = None):
-        self.sessao = requests.Session()
-        self.sessao.headers.update({'Accept': 'application/vnd.github.v3+json'})
-        if token:
-            self.sessao.headers['Authorization'] = f'token {token}'
+    def __init__(self, token: Optional[str] = None, limitador: Optional[LimitadorDeTaxa] = None,
+                 cache: Optional[CacheHttp] = None, url_graphql: str = URL_API_GRAPHQL,
+                 metricas: Optional[MetricasExecucao] = None,
+                 cache_negativo: Optional[CacheNegativoReadme] = None):
+        taxa_base = REQUISICOES_POR_SEGUNDO_AUTENTICADO if token else REQUISICOES_POR_SEGUNDO
+        self.limitador = limitador or LimitadorDeTaxa(taxa_base)
+        self.intervalo_base = self.limitador.intervalo_minimo
+        # Orçamento por recurso de rate limit ('core', 'graphql'): {'restante', 'limite', 'reset'}
+        self.orcamento: dict[str, dict] = {}
+        self._trava_orcamento = threading.Lock()
+        self.cache = cache
+        self.metricas = metricas
+        self.cache_negativo = cache_negativo
+        self.url_graphql = url_graphql
+        self.autenticado = bool(token)
+        self.token = token
+        self._sessao = None
+        self._trava_sessao = threading.Lock()
+
+    @property
+    def sessao(self) -> requests.Session:
+        """Sessão keep-alive única para API e raw, criada (e requests importado) no primeiro uso."""
+        if self._sessao is None:
+            with self._trava_sessao:
+                if self._sessao is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    sessao = requests.Session()
+                    # O pool acompanha as threads em paralelo
+                    adaptador = HTTPAdapter(pool_connections=4, pool_maxsize=TAMANHO_POOL_CONEXOES)
+                    sessao.mount('https://', adaptador)
+                    sessao.mount('http://', adaptador)
+                    sessao.headers.update({'Accept': 'application/vnd.github.v3+json'})
+                    if self.token:
+                        sessao.headers['Authorization'] = f'token {self.token}'
+                    self._sessao = sessao
+        return self._sessao
+
+    def _recurso_rate_limit(self, url: str) -> str | None:
+        """Recurso de rate limit do GitHub que a URL consome (raw não tem limite de API)."""
+        if url == self.url_graphql:
+            return 'graphql'
+        if 'raw.githubusercontent.com' in url:
+            return None
+        return 'core'
+
+    def _atualizar_orcamento(self, resposta: requests.Response):
+        """Lê X-RateLimit-* e ajusta o ritmo global conforme o orçamento restante."""
+        restante = resposta.headers.get('X-RateLimit-Remaining')
+        if restante is None:
+            return
+        recurso = resposta.headers.get('X-RateLimit-Resource', 'core')
+        limite = int(resposta.headers.get('X-RateLimit-Limit') or 0)
+        reset = float(resposta.headers.get('X-RateLimit-Reset') or 0)
+        restante = int(restante)
+        with self._trava_orcamento:
+            self.orcamento[recurso] = {'restante': restante, 'limite': limite, 'reset': reset}
+
+        if restante > 0 and limite and restante < limite * FRACAO_RESERVA_RATE_LIMIT:
+            # Pouco orçamento: distribui o restante até ao reset (sem nunca passar da espera máxima)
+            intervalo = min((reset - time.time()) / restante, MAXIMO_ESPERA_RATE_LIMIT)
+            self.limitador.definir_intervalo(max(self.intervalo_base, intervalo))
+        elif restante > 0:
+            self.limitador.definir_intervalo(self.intervalo_base)
+
+    def _espera_por_orcamento_esgotado(self, recurso: str | None) -> float:
+        """Segundos até o reset se o orçamento do recurso estiver esgotado; 0 caso contrário."""
+        with self._trava_orcamento:
+            info = self.orcamento.get(recurso) if recurso else None
+        if not info or info['restante'] > 0:
+            return 0.0
+        return max(0.0, info['reset'] - time.time())
+
+    def _calcular_backoff(self, tentativa: int, resposta: requests.Response | None) -> float:
+        """Retry-After tem prioridade; senão backoff exponencial com jitter total."""
+        if resposta is not None:
+            retry_after = resposta.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        return random.uniform(0, BASE_BACKOFF_SEGUNDOS * (2 ** tentativa))
+
+    @staticmethod
+    def _eh_limite_secundario(resposta: requests.Response) -> bool:
+        if resposta.status_code not in (403, 429):
+            return False
+        return 'Retry-After' in resposta.headers or 'secondary rate limit' in resposta.text.lower()
+
+    def _requisitar(self, metodo: str, url: str, **kwargs) -> requests.Response:
+        """
+        Envia a requisição respeitando o ritmo global e o orçamento de rate limit.
+        Repete 5xx/429/limite secundário/erros de rede com backoff exponencial e jitter.
+        Com o orçamento esgotado, espera pelo reset se for curto; senão falha de imediato
+        com HTTPError (o chamador pode usar cache ou fallback raw).
+        """
+        import requests
+        recurso = self._recurso_rate_limit(url)
+        kwargs.setdefault('timeout', 20)
+        for tentativa in range(MAXIMO_RETENTATIVAS + 1):
+            espera_reset = self._espera_por_orcamento_esgotado(recurso)
+            if espera_reset > MAXIMO_ESPERA_RATE_LIMIT:
+                raise requests.HTTPError(f'Rate limit do GitHub ({recurso}) esgotado; reset em {espera_reset:.0f}s')
+            if espera_reset > 0:
+                self.limitador.pausar_por(espera_reset)
+
+            self.limitador.aguardar_vez()
+            try:
+                resposta = self.sessao.request(metodo, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if tentativa == MAXIMO_RETENTATIVAS:
+                    raise
+                time.sleep(self._calcular_backoff(tentativa, None))
+                continue
+
+            if self.metricas:
+                self.metricas.registrar_http(
+                    len(resposta.content),
+                    resposta.status_code == 304,
+                    resposta.headers.get('X-RateLimit-Remaining'),
+                )
+            self._atualizar_orcamento(resposta)
+
+            limite_primario = resposta.status_code in (403, 429) and resposta.headers.get('X-RateLimit-Remaining') == '0'
+            retentavel = (resposta.status_code in STATUS_RETENTAVEIS or limite_primario
+                          or self._eh_limite_secundario(resposta))
+            if not retentavel or tentativa == MAXIMO_RETENTATIVAS:
+                return resposta
+            if limite_primario and not self._eh_limite_secundario(resposta):
+                # A espera pelo reset é tratada no início do ciclo; se o reset guardado já passou
+                # (relógio dessincronizado ou cabeçalho antigo) recua com backoff em vez de repetir logo
+                if self._espera_por_orcamento_esgotado(recurso) <= 0:
+                    time.sleep(self._calcular_backoff(tentativa, None))
+                continue
+            espera = self._calcular_backoff(tentativa, resposta)
+            if espera > MAXIMO_ESPERA_RATE_LIMIT:
+                return resposta
+            if self._eh_limite_secundario(resposta):
+                # Limite secundário vale para o cliente inteiro: pausa todas as threads
+                self.limitador.pausar_por(espera)
+            else:
+                time.sleep(espera)
+        return resposta
+
+    def _get_condicional(self, url: str, headers: dict | None = None) -> tuple[int, str]:
+        """
+        Realiza GET condicional (If-None-Match / If-Modified-Since) usando o cache em disco.
+        Uma resposta 304 é servida a partir do cache como se fosse 200. Se o rate limit
+        estiver esgotado, a última versão em cache é usada como fallback.
+        Retorna (status, texto).
+        """
+        import requests
+        headers_requisicao = dict(headers or {})
+        accept = headers_requisicao.get('Accept') or self.sessao.headers.get('Accept', '')
+        entrada = self.cache.obter(url, accept) if self.cache else None
+        if entrada:
+            if entrada.get('etag'):
+                headers_requisicao['If-None-Match'] = entrada['etag']
+            if entrada.get('last_modified'):
+                headers_requisicao['If-Modified-Since'] = entrada['last_modified']
+
+        try:
+            resposta = self._requisitar('GET', url, headers=headers_requisicao or None)
+        except requests.HTTPError:
+            if entrada:
+                return 200, entrada['corpo']
+            raise
+
+        if resposta.status_code == 304 and entrada:
+            return 200, entrada['corpo']
+
+        if resposta.status_code == 200 and self.cache:
+            etag = resposta.headers.get('ETag')
+            last_modified = resposta.headers.get('Last-Modified')
+            if etag or last_modified:
+                self.cache.guardar(url, accept, etag, last_modified, resposta.text)
+        return resposta.status_code, resposta.text
 
     def obter_json_api(self, url: str) -> dict:
         """Realiza GET esperando JSON como resposta."""
-        resposta = self.sessao.get(url, timeout=20)
-        resposta.raise_for_status()
-        return resposta.json()
+        import requests
+        status, texto = self._get_condicional(url)
+        if status >= 400:
+            raise requests.HTTPError(f'{status} ao acessar {url}')
+        return json.loads(texto)
 
     def obter_conteudo_texto(self, url: str) -> str | None:
         """Realiza GET esperando texto puro (raw) como resposta."""
         try:
-            resposta = requests.get(url, timeout=20)
-            if resposta.status_code == 200:
-                return resposta.text
+            status, texto = self._get_condicional(url)
+            if status == 200:
+                return texto
         except Exception as erro:
-            print(f"Erro ao buscar texto raw de {url}: {erro}")
+            imprimir_linha(f"Erro ao buscar texto raw de {url}: {erro}")
         return None
 
     def buscar_metadados_repositorio(self, dono: str, repositorio: str) -> dict:
         url = f'https://api.github.com/repos/{dono}/{repositorio}'
         return self.obter_json_api(url)
 
+    def listar_repositorios_utilizador(self, utilizador: str) -> Iterator[dict]:
+        """
+        Enumera os repositórios públicos de um utilizador ou organização, página a página
+        (REPOSITORIOS_POR_PAGINA por requisição), do push mais recente para o mais antigo.
+        """
+        pagina = 1
+        while True:
+            url = (f'https://api.github.com/users/{utilizador}/repos'
+                   f'?type=owner&sort=pushed&direction=desc&per_page={REPOSITORIOS_POR_PAGINA}&page={pagina}')
+            repositorios = self.obter_json_api(url)
+            yield from repositorios
+            if len(repositorios) < REPOSITORIOS_POR_PAGINA:
+                return
+            pagina += 1
+
+    @staticmethod
+    def montar_query_lote_graphql(repositorios: list[tuple[str, str]]) -> tuple[str, dict]:
+        """Monta uma única query GraphQL (com variáveis) para um lote de repositórios."""
+        declaracoes = []
+        campos = []
+        variaveis = {}
+        campos_readme = ' '.join(
+            f'readme{i}: object(expression: "HEAD:{nome}") {{ ... on Blob {{ text }} }}'
+            for i, nome in enumerate(NOMES_README_GRAPHQL)
+        )
+        for i, (dono, repositorio) in enumerate(repositorios):
+            declaracoes.append(f'$dono{i}: String!, $nome{i}: String!')
+            campos.append(
+                f'r{i}: repository(owner: $dono{i}, name: $nome{i}) '
+                f'{{ description pushedAt defaultBranchRef {{ name }} {campos_readme} }}'
+            )
+            variaveis[f'dono{i}'] = dono
+            variaveis[f'nome{i}'] = repositorio
+        query = f'query({", ".join(declaracoes)}) {{ {" ".join(campos)} }}'
+        return query, variaveis
+
+    def buscar_lote_graphql(self, repositorios: list[tuple[str, str]]) -> dict[tuple[str, str], dict]:
+        """
+        Obtém descrição, branch padrão e texto do README de vários repositórios
+        numa única requisição GraphQL. Repositórios não encontrados ficam fora do resultado.
+        Retorna {(dono, repositorio): {'description', 'default_branch', 'pushed_at', 'readme'}}.
+        """
+        if not repositorios:
+            return {}
+        query, variaveis = self.montar_query_lote_graphql(repositorios)
+        resposta = self._requisitar('POST', self.url_graphql, json={'query': query, 'variables': variaveis}, timeout=30)
+        resposta.raise_for_status()
+        dados = (resposta.json() or {}).get('data') or {}
+
+        resultado = {}
+        for i, chave in enumerate(repositorios):
+            info = dados.get(f'r{i}')
+            if not info:
+                continue
+            readme = None
+            for j in range(len(NOMES_README_GRAPHQL)):
+                blob = info.get(f'readme{j}')
+                if blob and blob.get('text'):
+                    readme = blob['text']
+                    break
+            resultado[chave] = {
+                'description': info.get('description') or "",
+                'default_branch': (info.get('defaultBranchRef') or {}).get('name'),
+                'pushed_at': info.get('pushedAt'),
+                'readme': readme,
+            }
+        return resultado
+
     def buscar_readme(self, dono: str, repositorio: str, branch_padrao: str | None = None) -> str | None:
         """
         Obtém o README do repositório.
@@ -64,17 +678,17 @@ class ClienteGithub:
         1) Tenta API /readme com Accept raw.
         2) Tenta URLs raw diretas testando múltiplos branches e nomes de arquivo,
            mesmo quando não há branch_padrao disponível (ex.: falha da API).
+           Os candidatos são sondados em paralelo, ignorando os que o cache negativo
+           já sabe que não existem; vence o primeiro existente na ordem de preferência.
         """
         # Tentativa 1: Via API (mais estável para metadados)
         url_api = f'https://api.github.com/repos/{dono}/{repositorio}/readme'
-        # self.sessao.headers pode ser um Mapping; usar dict(...) evita warnings de tipo
-        headers_personalizados = dict(self.sessao.headers)
-        headers_personalizados['Accept'] = 'application/vnd.github.v3.raw'
+        headers_personalizados = {'Accept': 'application/vnd.github.v3.raw'}
 
         try:
-            resposta = requests.get(url_api, headers=headers_personalizados, timeout=20)
-            if resposta.status_code == 200 and resposta.text:
-                return resposta.text
+            status, texto = self._get_condicional(url_api, headers_personalizados)
+            if status == 200 and texto:
+                return texto
         except Exception:
             # Falha silenciosa para tentar o método raw direto
             pass
@@ -96,15 +710,41 @@ class ClienteGithub:
             'README.markdown', 'README.rst', 'README.txt', 'README'
         ]
 
-        for b in branches:
-            for nome in nomes_arquivos:
-                url_raw = f'https://raw.githubusercontent.com/{dono}/{repositorio}/{b}/{nome}'
-                conteudo = self.obter_conteudo_texto(url_raw)
+        candidatos = [
+            (b, nome) for b in branches for nome in nomes_arquivos
+            if not (self.cache_negativo and self.cache_negativo.sabe_que_nao_existe(dono, repositorio, b, nome))
+        ]
+        if not candidatos:
+            return None
+
+        # As threads do pool não herdam o registo de métricas do repositório em curso
+        sondar = self.metricas.vincular_registo_atual(self._sondar_readme_raw) if self.metricas else self._sondar_readme_raw
+        executor = ThreadPoolExecutor(max_workers=min(MAXIMO_SONDAGENS_README_PARALELAS, len(candidatos)))
+        try:
+            futuros = [executor.submit(sondar, dono, repositorio, b, nome) for b, nome in candidatos]
+            # Percorre na ordem de preferência: só espera pelos candidatos mais prioritários
+            for futuro in futuros:
+                conteudo = futuro.result()
                 if conteudo:
                     return conteudo
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         return None
 
+    def _sondar_readme_raw(self, dono: str, repositorio: str, branch: str, nome: str) -> str | None:
+        url_raw = f'https://raw.githubusercontent.com/{dono}/{repositorio}/{branch}/{nome}'
+        if self.metricas:
+            self.metricas.registrar_sondagem_fallback()
+        try:
+            status, texto = self._get_condicional(url_raw)
+        except Exception as erro:
+            imprimir_linha(f"Erro ao buscar texto raw de {url_raw}: {erro}")
+            return None
+        if status == 404 and self.cache_negativo:
+            self.cache_negativo.registrar_inexistente(dono, repositorio, branch, nome)
+        return texto if status == 200 and texto else None
+
 
 class ExtratorDeInformacoesUrl:
     """ Responsável por processar strings de URL e extrair componentes como dono e repositório. """
@@ -137,6 +777,86 @@ class ExtratorDeInformacoesUrl:
         return None, None
 
 
+class DescobridorDeRepositorios:
+    """
+    Resolve as fontes configuradas numa lista ordenada e sem duplicados de URLs de repositório.
+    Formato da configuração (JSON):
+        {
+          "repositorios": ["https://github.com/dono/repo", ...],
+          "utilizadores": [
+            {"nome": "dono", "topicos": ["portfolio"], "incluir_forks": false, "alterado_desde": "2024-01-01"}
+          ]
+        }
+    Os utilizadores/organizações são enumerados pela API paginada; os metadados obtidos nessa
+    listagem (descrição, branch padrão, pushed_at) dispensam a chamada /repos/{dono}/{repo}.
+    """
+    def __init__(self, cliente: ClienteGithub):
+        self.cliente = cliente
+
+    @staticmethod
+    def carregar_configuracao(arquivo: Path) -> dict:
+        return json.loads(arquivo.read_text(encoding='utf-8'))
+
+    @staticmethod
+    def repositorio_passa_filtros(info: dict, filtro: dict) -> bool:
+        if info.get('fork') and not filtro.get('incluir_forks', False):
+            return False
+        topicos = filtro.get('topicos') or []
+        if topicos and not set(topicos) & set(info.get('topics') or []):
+            return False
+        alterado_desde = filtro.get('alterado_desde')
+        # Datas ISO 8601 comparam corretamente como texto (ex.: '2024-01-01' <= '2024-03-05T10:00:00Z')
+        if alterado_desde and (info.get('pushed_at') or '') < alterado_desde:
+            return False
+        return True
+
+    def resolver(self, configuracao: dict) -> tuple[list[str], dict[tuple[str, str], dict]]:
+        """Retorna (urls, metadados_descobertos), este último indexado por (dono, repositorio)."""
+        urls = []
+        vistos = set()
+        # O site (script.js, nomes dos fragmentos) identifica cada projeto só pelo nome do
+        # repositório: o mesmo nome vindo de outro dono não pode ser publicado e é ignorado
+        donos_por_nome: dict[str, str] = {}
+        metadados = {}
+
+        def _adicionar(url: str) -> tuple[str, str] | None:
+            dono, repositorio = ExtratorDeInformacoesUrl.extrair_dono_e_repositorio(url)
+            if not dono or not repositorio or (dono.lower(), repositorio.lower()) in vistos:
+                return None
+            dono_existente = donos_por_nome.get(repositorio.lower())
+            if dono_existente is not None:
+                print(f'  AVISO FONTES: {dono}/{repositorio} ignorado; o nome "{repositorio}" já é usado por {dono_existente}/{repositorio}.')
+                return None
+            vistos.add((dono.lower(), repositorio.lower()))
+            donos_por_nome[repositorio.lower()] = dono
+            urls.append(f'https://github.com/{dono}/{repositorio}')
+            return dono, repositorio
+
+        for url in configuracao.get('repositorios') or []:
+            _adicionar(url)
+
+        for filtro in configuracao.get('utilizadores') or []:
+            if isinstance(filtro, str):
+                filtro = {'nome': filtro}
+            try:
+                listados = list(self.cliente.listar_repositorios_utilizador(filtro['nome']))
+            except Exception as e:
+                print(f"  AVISO FONTES: falha ao listar repositórios de {filtro['nome']} ({e}).")
+                continue
+            aceites = [info for info in listados if self.repositorio_passa_filtros(info, filtro)]
+            print(f"Fonte {filtro['nome']}: {len(aceites)} de {len(listados)} repositórios selecionados.")
+            for info in aceites:
+                chave = _adicionar(info.get('html_url') or f"{filtro['nome']}/{info.get('name')}")
+                if chave:
+                    metadados[chave] = {
+                        'description': info.get('description') or "",
+                        'default_branch': info.get('default_branch'),
+                        'pushed_at': info.get('pushed_at'),
+                        'readme': None,
+                    }
+        return urls, metadados
+
+
 class ProcessadorMarkdown:
     """
     Responsável por limpar o texto Markdown bruto e separar Título do Corpo.
@@ -216,7 +936,24 @@ class ConversorMarkdownHtml:
     """
     Encapsula a lógica de conversão de MD para HTML, incluindo pré-processamento 
     para listas e negrito.
+    Mantém uma instância markdown.Markdown por thread (reiniciada com reset() entre
+    documentos) e, opcionalmente, memoriza resultados num cache LRU pelo hash da entrada.
     """
+    EXTENSOES_MARKDOWN = ['extra', 'sane_lists', 'nl2br']
+
+    def __init__(self, tamanho_memo: int = 0):
+        self._local = threading.local()
+        self.tamanho_memo = tamanho_memo
+        self._memo: OrderedDict[str, str] = OrderedDict()
+        self._trava_memo = threading.Lock()
+
+    def _obter_instancia_markdown(self) -> markdown.Markdown:
+        instancia = getattr(self._local, 'markdown', None)
+        if instancia is None:
+            import markdown
+            instancia = markdown.Markdown(extensions=self.EXTENSOES_MARKDOWN)
+            self._local.markdown = instancia
+        return instancia
 
     @staticmethod
     def escapar_html_basico(texto: str) -> str:
@@ -227,6 +964,23 @@ class ConversorMarkdownHtml:
                      .replace('>', '&gt;'))
 
     def converter(self, corpo_markdown: str) -> str:
+        if self.tamanho_memo <= 0:
+            return self._converter_sem_memo(corpo_markdown)
+
+        chave = hashlib.sha256((corpo_markdown or '').encode('utf-8')).hexdigest()
+        with self._trava_memo:
+            if chave in self._memo:
+                self._memo.move_to_end(chave)
+                return self._memo[chave]
+
+        html = self._converter_sem_memo(corpo_markdown)
+        with self._trava_memo:
+            self._memo[chave] = html
+            while len(self._memo) > self.tamanho_memo:
+                self._memo.popitem(last=False)
+        return html
+
+    def _converter_sem_memo(self, corpo_markdown: str) -> str:
         # Pré-processamento: Remover negrito (**texto**) se estiver dentro de links ou colchetes
         # Ex: [**Texto**] -> [Texto]
         def _remover_negrito_interno(match):
@@ -241,18 +995,20 @@ class ConversorMarkdownHtml:
         # Separar cabeçalhos de listas
         corpo_preparado = re.sub(r'(?m)^(#{1,6} .*?)\n((?:[-*+]|\d+\.)\s+)', r'\1\n\n\2', corpo_preparado)
 
-        # Conversão usando biblioteca Markdown
-        html = markdown.markdown(
-            corpo_preparado or '', 
-            extensions=['extra', 'sane_lists', 'nl2br']
-        )
-        return html
+        # Conversão usando a instância Markdown desta thread (reset evita estado residual)
+        conversor = self._obter_instancia_markdown()
+        conversor.reset()
+        return conversor.convert(corpo_preparado or '')
 
 
 class FormatadorHtml:
     """
     Responsável por limpar e formatar o HTML gerado.
     Remove tags indesejadas, corrige listas mal formadas e remove badges.
+
+    Todos os padrões são compilados uma única vez no nível da classe. As passadas de
+    emblemas/imagens continuam sequenciais: a remoção feita por uma pode criar o alvo
+    da seguinte, o que uma alternância numa única varredura não reproduz.
     """
     PADROES_EMBLEMAS = [
         r'<p[^>]*>\s*<img[^>]*alt="[^"]*\.NET Framework"[^>]*>\s*</p>',
@@ -261,24 +1017,49 @@ class FormatadorHtml:
         r'<img[^>]*alt="[^"]*\.NET Framework"[^>]*>',
         r'<img[^>]*src="[^"]*shields\.io[^"]*"[^>]*>',
         r'<img[^>]*alt="[^"]*badge[^"]*"[^>]*>',
-        r'<p[^>]*>\s*(?:<img[^>]*>[\s\n]*)+</p>',
     ]
+    PADRAO_PARAGRAFO_SO_IMAGENS = r'<p[^>]*>\s*(?:<img[^>]*>[\s\n]*)+</p>'
+
+    # Passada 1: emblemas (com e sem <p> envolvente), um padrão de cada vez, por esta ordem
+    REGEX_EMBLEMAS = tuple(re.compile(padrao, flags=re.IGNORECASE | re.MULTILINE) for padrao in PADROES_EMBLEMAS)
+    # Passada 2: parágrafos só com imagens
+    REGEX_PARAGRAFOS_SO_IMAGENS = re.compile(PADRAO_PARAGRAFO_SO_IMAGENS, flags=re.IGNORECASE | re.MULTILINE)
+    # Passada 3 (separada: a remoção da passada 2 pode deixar vazio um parágrafo que a envolvia)
+    REGEX_PARAGRAFO_VAZIO = re.compile(r'<p>\s*</p>')
+
+    REGEX_TITULO_U0001_COM_BR = re.compile(r"<p>\u0001([^<]+?)<br\s*\/??\s*>")
+    REGEX_TITULO_U0001_PARAGRAFO = re.compile(r"<p>\u0001([^<]+?)<\/p>")
+
+    REGEX_LINK_VISITE = re.compile(r'<p><strong>Visite:</strong>\s*<a[^>]*>.*?</a></p>')
+
+    # Reparação de listas: varredura linear por tokens (sem padrões com .*? entre
+    # <li> e </li>, que retrocediam de forma quadrática em HTML mal fechado)
+    REGEX_TOKENS_LISTA = re.compile(r'<li>|</li>|<[uo]l')
+    REGEX_SEPARADOR_PARAGRAFOS = re.compile(r'</p>\s*<p>')
+    # A lookbehind ancora o separador no início de cada bloco de espaços, evitando
+    # recomeçar a tentativa em cada posição de uma sequência longa de espaços
+    REGEX_SEPARADOR_HIFEN = re.compile(r'(?<!\s)\s+-\s+(?=(?:<strong>|[A-Za-zÁ-Úá-ú]))')
 
     REGEX_REMOVER_LINHA_DEMO = re.compile(
         r'<p[^>]*>[^<]*Uma versão de demonstração está disponível online em[\s\S]*?</p>',
         flags=re.IGNORECASE
     )
+    REGEX_UL_VAZIA = re.compile(r'<ul>\s*</ul>')
+    REGEX_OL_VAZIA = re.compile(r'<ol>\s*</ol>')
+    REGEX_QUEBRAS_EXCESSIVAS = re.compile(r'\n{3,}')
 
     def limpar_emblemas_e_imagens_status(self, html: str) -> str:
         if not html: 
             return html
         
         html_limpo = html
-        for padrao in self.PADROES_EMBLEMAS:
-            html_limpo = re.sub(padrao, '', html_limpo, flags=re.IGNORECASE | re.MULTILINE)
-        
-        # Remover parágrafos vazios resultantes da remoção
-        html_limpo = re.sub(r'<p>\s*</p>', '', html_limpo)
+        # Todos os padrões de emblemas/imagens exigem uma <img>
+        if '<img' in html_limpo.lower():
+            for regex in self.REGEX_EMBLEMAS:
+                html_limpo = regex.sub('', html_limpo)
+            html_limpo = self.REGEX_PARAGRAFOS_SO_IMAGENS.sub('', html_limpo)
+        # Remover os parágrafos vazios resultantes da remoção
+        html_limpo = self.REGEX_PARAGRAFO_VAZIO.sub('', html_limpo)
         return html_limpo.strip()
 
     def corrigir_titulos_u0001(self, html: str) -> str:
@@ -290,11 +1071,13 @@ class FormatadorHtml:
         """
         if not html:
             return ""
+        if "\u0001" not in html:
+            return html
         out = html
         # 1) Parágrafo com título + <br>
-        out = re.sub(r"<p>\u0001([^<]+?)<br\s*\/??\s*>", lambda m: f"<h2>{self._escape_texto(m.group(1).strip())}</h2><p>", out)
+        out = self.REGEX_TITULO_U0001_COM_BR.sub(lambda m: f"<h2>{self._escape_texto(m.group(1).strip())}</h2><p>", out)
         # 2) Parágrafo que é só o título
-        out = re.sub(r"<p>\u0001([^<]+?)<\/p>", lambda m: f"<h2>{self._escape_texto(m.group(1).strip())}</h2>", out)
+        out = self.REGEX_TITULO_U0001_PARAGRAFO.sub(lambda m: f"<h2>{self._escape_texto(m.group(1).strip())}</h2>", out)
         # 3) Remover quaisquer ocorrências restantes
         out = out.replace("\u0001", "")
         return out
@@ -307,83 +1090,129 @@ class FormatadorHtml:
                 .replace('>', '&gt;')
                )
 
+    @staticmethod
+    def _extrair_item_de_paragrafo(linha: str) -> Optional[tuple]:
+        """
+        Reconhece uma linha '<p>- texto</p>' ou '<p>1. texto</p>' (item de lista que o
+        Markdown deixou num parágrafo). Devolve (ordenada, texto) ou None.
+        Feito com operações de string para custar O(len(linha)) mesmo em linhas longas.
+        """
+        if not linha.startswith('<p>'):
+            return None
+        linha = linha.rstrip()
+        if len(linha) < 7 or not linha.endswith('</p>'):
+            return None
+        corpo = linha[3:-4].lstrip()
+        if corpo[:1] in ('-', '*', '+'):
+            ordenada, resto = False, corpo[1:]
+        else:
+            fim_digitos = 0
+            while fim_digitos < len(corpo) and corpo[fim_digitos].isdecimal():
+                fim_digitos += 1
+            if fim_digitos == 0 or corpo[fim_digitos:fim_digitos + 1] != '.':
+                return None
+            ordenada, resto = True, corpo[fim_digitos + 1:]
+        if not resto[:1].isspace():
+            return None
+        return ordenada, resto.lstrip()
+
     def corrigir_listas_html(self, html: str) -> str:
         """Corrige estruturas <ul> e <ol> que podem ter sido geradas incorretamente."""
         linhas = html.split('\n')
         saida = []
-        dentro_ul = False
-        dentro_ol = False
+        lista_aberta = None  # 'ul', 'ol' ou None
 
         for linha in linhas:
-            # Detectar itens de lista não ordenada soltos em parágrafos
-            match_ul = re.match(r'<p>\s*[-*+]\s+(.*?)</p>\s*$', linha)
-            # Detectar itens de lista ordenada soltos em parágrafos
-            match_ol = re.match(r'<p>\s*(\d+)\.\s+(.*?)</p>\s*$', linha)
-
-            if match_ul:
-                if not dentro_ul:
-                    if dentro_ol: saida.append('</ol>'); dentro_ol = False
-                    saida.append('<ul>'); dentro_ul = True
-                saida.append(f'<li>{match_ul.group(1)}</li>')
-                continue
-
-            if match_ol:
-                if not dentro_ol:
-                    if dentro_ul: saida.append('</ul>'); dentro_ul = False
-                    saida.append('<ol>'); dentro_ol = True
-                saida.append(f'<li>{match_ol.group(2)}</li>')
+            # Detectar itens de lista (ordenada ou não) soltos em parágrafos
+            item = self._extrair_item_de_paragrafo(linha)
+            if item:
+                ordenada, texto = item
+                tipo = 'ol' if ordenada else 'ul'
+                if lista_aberta != tipo:
+                    if lista_aberta: saida.append(f'</{lista_aberta}>')
+                    saida.append(f'<{tipo}>'); lista_aberta = tipo
+                saida.append(f'<li>{texto}</li>')
                 continue
 
             # Fechar listas se encontrar uma linha normal
-            if dentro_ul: saida.append('</ul>'); 
-            dentro_ul = False
-            if dentro_ol: saida.append('</ol>'); 
-            dentro_ol = False
+            if lista_aberta: saida.append(f'</{lista_aberta}>')
+            lista_aberta = None
             saida.append(linha)
 
-        if dentro_ul: saida.append('</ul>')
-        if dentro_ol: saida.append('</ol>')
-        
+        if lista_aberta: saida.append(f'</{lista_aberta}>')
+
         return '\n'.join(saida)
 
+    def _colapsar_paragrafos(self, conteudo: str) -> str:
+        """'<p>A</p> <p>B</p>' => 'A<br /><br />B'. Sem <p> nas bordas devolve o conteúdo intacto."""
+        interno = conteudo.strip()
+        if not (interno.startswith('<p>') and interno.endswith('</p>')):
+            return conteudo
+        interno = self.REGEX_SEPARADOR_PARAGRAFOS.sub('<br /><br />', interno)
+        return interno[3:-4]
+
+    def _dividir_por_hifen(self, conteudo: str) -> Optional[list]:
+        """Partes de '<li>Item 1 - Item 2</li>' ou None se o item não deve ser dividido."""
+        if ' - ' not in conteudo or '<ul' in conteudo or '<ol' in conteudo:
+            return None
+        partes = self.REGEX_SEPARADOR_HIFEN.split(conteudo)
+        if len(partes) <= 1:
+            return None
+        return [parte.strip() for parte in partes if parte.strip()]
+
+    def reparar_itens_lista(self, html: str, colapsar_paragrafos: bool = True, dividir_hifens: bool = True) -> str:
+        """
+        Passada única e linear sobre os <li> do documento.
+
+        Os tokens <li>, </li> e <ul/<ol são emparelhados com uma pilha; só os itens
+        "folha" (sem sub-lista nem <li> aninhado) são reescritos, pelo que cada
+        caractere é visitado um número constante de vezes. Um <li> sem </li> fica
+        intacto em vez de fazer o padrão percorrer o resto do documento.
+        """
+        pilha = []  # [posição do <li>, tem_aninhamento]
+        pedacos = []
+        cursor = 0
+
+        for token in self.REGEX_TOKENS_LISTA.finditer(html):
+            marca = token.group()
+            if marca == '<li>':
+                if pilha:
+                    pilha[-1][1] = True
+                pilha.append([token.start(), False])
+            elif marca != '</li>':
+                if pilha:
+                    pilha[-1][1] = True
+            elif pilha:
+                inicio, tem_aninhamento = pilha.pop()
+                if tem_aninhamento:
+                    continue
+                original = html[inicio + 4:token.start()]
+                conteudo = self._colapsar_paragrafos(original) if colapsar_paragrafos else original
+                partes = self._dividir_por_hifen(conteudo) if dividir_hifens else None
+                if partes is None and conteudo is original:
+                    continue
+                pedacos.append(html[cursor:inicio])
+                if partes is None:
+                    pedacos.append(f'<li>{conteudo}</li>')
+                else:
+                    pedacos.extend(f'<li>{parte}</li>' for parte in partes)
+                cursor = token.end()
+
+        if not pedacos:
+            return html
+        pedacos.append(html[cursor:])
+        return ''.join(pedacos)
+
     def remover_paragrafos_dentro_de_li(self, html: str) -> str:
         """Transforma <li><p>Texto</p></li> em <li>Texto</li>."""
-        def _colapsar(match):
-            interno = match.group(1).strip()
-            interno = re.sub(r'</p>\s*<p>', '<br /><br />', interno)
-            interno = re.sub(r'^<p>|</p>$', '', interno)
-            return f'<li>{interno}</li>'
-            
-        html = re.sub(r'<li>\s*((?:<p>.*?</p>\s*)+)\s*</li>', _colapsar, html, flags=re.DOTALL)
-        html = re.sub(r'<li>\s*<p>(.*?)</p>\s*</li>', r'<li>\1</li>', html, flags=re.DOTALL)
-        return html
+        return self.reparar_itens_lista(html, dividir_hifens=False)
 
     def dividir_li_concatenados(self, html: str) -> str:
         """
         Divide itens de lista que usam ' - ' como separador visual mas deveriam ser múltiplos itens.
         Ex: <li>Item 1 - Item 2</li> vira <li>Item 1</li><li>Item 2</li>
         """
-        def _expandir(match):
-            bloco_li = match.group(0)
-            # Se tiver sub-listas, não mexe
-            if '<ul' in bloco_li or '<ol' in bloco_li:
-                return bloco_li
-            
-            m = re.match(r'<li>([\s\S]*?)</li>', bloco_li)
-            if not m:
-                return bloco_li
-            conteudo_interno = m.group(1)
-            if ' - ' not in conteudo_interno:
-                return bloco_li
-            
-            # Separa por hífen, mas tenta evitar quebrar palavras compostas (heuristicamente)
-            partes = re.split(r'\s+-\s+(?=(?:<strong>|[A-Za-zÁ-Úá-ú]))', conteudo_interno)
-            if len(partes) <= 1:
-                return bloco_li
-            
-            return ''.join(f'<li>{parte.strip()}</li>' for parte in partes if parte.strip())
-
-        return re.sub(r'<li>[\s\S]*?</li>', _expandir, html)
+        return self.reparar_itens_lista(html, colapsar_paragrafos=False)
 
     def limpeza_final(self, html: Optional[str], nome_repositorio: str) -> str:
         # aceita None como entrada e normaliza para string vazia
@@ -395,36 +1224,296 @@ class FormatadorHtml:
         
         # Lógica específica de portfólio
         if nome_repositorio in ["tiago-daniel-guerreiro.github.io", "Site-Manga"]:
-            html = re.sub(r'<p><strong>Visite:</strong>\s*<a[^>]*>.*?</a></p>', '', html)
+            html = self.REGEX_LINK_VISITE.sub('', html)
 
         # Limpezas estruturais
         html = self.corrigir_listas_html(html)
-        html = self.remover_paragrafos_dentro_de_li(html)
-        html = self.dividir_li_concatenados(html)
+        # Parágrafos dentro de <li> e itens concatenados com ' - ' numa só passada
+        html = self.reparar_itens_lista(html)
         
         # Remover menção a demonstração online (se desejado)
         html = self.REGEX_REMOVER_LINHA_DEMO.sub('', html)
         
         # Remover listas vazias
-        html = re.sub(r'<ul>\s*</ul>', '', html)
-        html = re.sub(r'<ol>\s*</ol>', '', html)
+        html = self.REGEX_UL_VAZIA.sub('', html)
+        html = self.REGEX_OL_VAZIA.sub('', html)
         
         # Normalizar quebras de linha
-        html = re.sub(r'\n{3,}', '\n\n', html)
+        html = self.REGEX_QUEBRAS_EXCESSIVAS.sub('\n\n', html)
         
         return html.strip()
 
 
+class MinificadorHtml:
+    """
+    Minificação conservadora dos fragmentos HTML publicados.
+    Só remove espaço em branco que não altera a renderização: colapsa sequências de
+    espaços/quebras, retira espaços junto a tags de bloco e após <br />.
+    Conteúdo de <pre>, <textarea> e <script> é preservado intacto.
+    """
+    TAGS_BLOCO = 'address|article|aside|blockquote|dd|div|dl|dt|figcaption|figure|footer|h[1-6]|header|hr|li|nav|ol|p|pre|section|table|tbody|td|tfoot|th|thead|tr|ul'
+
+    REGEX_BLOCOS_PRESERVADOS = re.compile(r'(<(pre|textarea|script)\b[^>]*>[\s\S]*?</\2>)', flags=re.IGNORECASE)
+    REGEX_ESPACOS = re.compile(r'\s+')
+    REGEX_ESPACO_JUNTO_A_BLOCO = re.compile(rf'\s*(</?(?:{TAGS_BLOCO})\b[^>]*>)\s*', flags=re.IGNORECASE)
+    REGEX_ESPACO_APOS_BR = re.compile(r'(<br\s*/?>)\s+', flags=re.IGNORECASE)
+
+    def minificar(self, html: str) -> str:
+        if not html:
+            return ""
+        partes = self.REGEX_BLOCOS_PRESERVADOS.split(html)
+        saida = []
+        # split com 2 grupos devolve: [texto, bloco, nome_tag, texto, bloco, nome_tag, ...]
+        for i in range(0, len(partes), 3):
+            trecho = self.REGEX_ESPACOS.sub(' ', partes[i])
+            trecho = self.REGEX_ESPACO_JUNTO_A_BLOCO.sub(r'\1', trecho)
+            trecho = self.REGEX_ESPACO_APOS_BR.sub(r'\1', trecho)
+            saida.append(trecho)
+            if i + 1 < len(partes):
+                saida.append(partes[i + 1])
+        return ''.join(saida).strip()
+
+
+def chave_do_item(item: dict) -> str | None:
+    """Identificador único de um item do catálogo: 'dono/repo' tirado do link (ou o 'repo', sem link)."""
+    dono, repositorio = ExtratorDeInformacoesUrl.extrair_dono_e_repositorio(item.get('link') or '')
+    if dono and repositorio:
+        return f'{dono}/{repositorio}'
+    return item.get('repo') or None
+
+
+class ManifestoIncremental:
+    """
+    Manifesto de hashes para reconstrução incremental.
+    Para cada repositório guarda o hash do README combinado com a versão do pipeline;
+    se ambos não mudaram, o item anterior (title/description_html) é reaproveitado.
+    Hashes e itens anteriores são indexados por 'dono/repo' (donos diferentes podem ter
+    repositórios com o mesmo nome).
+    """
+    def __init__(self, arquivo: Path, dados_anteriores: list[dict]):
+        self.arquivo = arquivo
+        self.itens_anteriores = {chave_do_item(item): item for item in dados_anteriores if chave_do_item(item)}
+        self.hashes_anteriores: dict[str, str] = {}
+        self.hashes_atuais: dict[str, str] = {}
+        if arquivo.exists():
+            try:
+                self.hashes_anteriores = json.loads(arquivo.read_text(encoding='utf-8')).get('itens', {})
+            except (json.JSONDecodeError, AttributeError):
+                self.hashes_anteriores = {}
+
+    @staticmethod
+    def versao_pipeline() -> str:
+        """Hash do código das etapas de processamento e da versão da biblioteca markdown."""
+        import inspect
+        import markdown
+        codigo = ''.join(inspect.getsource(classe) for classe in (ProcessadorMarkdown, ConversorMarkdownHtml, FormatadorHtml))
+        return hashlib.sha256(f'{markdown.__version__}\n{codigo}'.encode('utf-8')).hexdigest()
+
+    def calcular_chave(self, texto_readme: str) -> str:
+        if not hasattr(self, '_versao_pipeline'):
+            self._versao_pipeline = self.versao_pipeline()
+        hash_readme = hashlib.sha256(texto_readme.encode('utf-8')).hexdigest()
+        return hashlib.sha256(f'{hash_readme}:{self._versao_pipeline}'.encode('utf-8')).hexdigest()
+
+    def obter_item_reaproveitavel(self, nome_completo: str, texto_readme: str) -> dict | None:
+        chave = self.calcular_chave(texto_readme)
+        self.hashes_atuais[nome_completo] = chave
+        item_anterior = self.itens_anteriores.get(nome_completo)
+        if item_anterior is None or self.hashes_anteriores.get(nome_completo) != chave:
+            return None
+        if 'description_html' not in item_anterior:
+            return None
+        return item_anterior
+
+    def manter_chave_anterior(self, nome_completo: str):
+        """Repositório reaproveitado sem ler o README (pushed_at igual): a chave anterior continua válida."""
+        if nome_completo in self.hashes_anteriores:
+            self.hashes_atuais[nome_completo] = self.hashes_anteriores[nome_completo]
+
+    def descartar_execucao(self):
+        """Execução cujo catálogo foi rejeitado: a próxima volta a comparar com a última aceite."""
+        self.hashes_atuais = {}
+
+    def avancar_execucao(self, dados_atuais: list[dict]):
+        """Usa o resultado da execução atual como base da próxima (modo contínuo)."""
+        self.itens_anteriores = {chave_do_item(item): item for item in dados_atuais if chave_do_item(item)}
+        self.hashes_anteriores = dict(self.hashes_atuais)
+        self.hashes_atuais = {}
+
+    def salvar(self):
+        self.arquivo.parent.mkdir(parents=True, exist_ok=True)
+        conteudo = {'itens': dict(sorted(self.hashes_atuais.items()))}
+        self.arquivo.write_text(json.dumps(conteudo, ensure_ascii=False, indent=2), encoding='utf-8')
+
+
+class ErroEsquemaCatalogo(ValueError):
+    """O catálogo gerado não respeita ESQUEMA_ITEM_CATALOGO."""
+
+
+class ValidadorDeEsquema:
+    """
+    Validador do subconjunto de JSON Schema usado pelos esquemas do catálogo:
+    type, required, properties, additionalProperties, items, minLength e pattern.
+    """
+    TIPOS = {
+        'object': dict, 'array': list, 'string': str, 'boolean': bool,
+        'integer': int, 'number': (int, float), 'null': type(None),
+    }
+
+    def __init__(self, esquema: dict):
+        self.esquema = esquema
+        self._padroes: dict[str, re.Pattern] = {}
+
+    def _tipo_confere(self, valor, tipo: str) -> bool:
+        # bool é subclasse de int em Python, mas não é 'integer'/'number' em JSON
+        if tipo in ('integer', 'number') and isinstance(valor, bool):
+            return False
+        return isinstance(valor, self.TIPOS[tipo])
+
+    def validar(self, valor, esquema: dict | None = None, caminho: str = '$') -> list[str]:
+        """Devolve as violações encontradas (lista vazia se o valor for válido)."""
+        esquema = self.esquema if esquema is None else esquema
+        tipos = esquema.get('type')
+        if tipos:
+            tipos = [tipos] if isinstance(tipos, str) else tipos
+            if not any(self._tipo_confere(valor, tipo) for tipo in tipos):
+                return [f'{caminho}: esperado {"/".join(tipos)}, encontrado {type(valor).__name__}']
+
+        erros = []
+        if isinstance(valor, dict):
+            propriedades = esquema.get('properties', {})
+            for campo in esquema.get('required', ()):
+                if campo not in valor:
+                    erros.append(f'{caminho}: campo obrigatório "{campo}" ausente')
+            for campo, subvalor in valor.items():
+                if campo in propriedades:
+                    erros.extend(self.validar(subvalor, propriedades[campo], f'{caminho}.{campo}'))
+                elif esquema.get('additionalProperties', True) is False:
+                    erros.append(f'{caminho}: campo inesperado "{campo}"')
+        elif isinstance(valor, list) and 'items' in esquema:
+            for i, subvalor in enumerate(valor):
+                erros.extend(self.validar(subvalor, esquema['items'], f'{caminho}[{i}]'))
+        elif isinstance(valor, str):
+            if len(valor) < esquema.get('minLength', 0):
+                erros.append(f'{caminho}: texto mais curto que {esquema["minLength"]}')
+            padrao = esquema.get('pattern')
+            if padrao:
+                if padrao not in self._padroes:
+                    self._padroes[padrao] = re.compile(padrao)
+                if not self._padroes[padrao].search(valor):
+                    erros.append(f'{caminho}: "{valor[:60]}" não corresponde a {padrao}')
+        return erros
+
+    def validar_em_fluxo(self, itens: Iterable[dict]) -> Iterator[dict]:
+        """
+        Repassa os itens um a um e, no fim, lança ErroEsquemaCatalogo se algum for inválido.
+        Usado à frente de salvar_dados_json: o ficheiro temporário é descartado e o
+        catálogo anterior fica intacto.
+        """
+        erros = []
+        for posicao, item in enumerate(itens):
+            erros.extend(self.validar(item, caminho=f'[{posicao}]'))
+            yield item
+        if erros:
+            raise ErroEsquemaCatalogo(f'{len(erros)} violação(ões) do esquema: ' + '; '.join(erros[:10]))
+
+
+class ComparadorDeCatalogos:
+    """
+    Diferença entre duas versões do catálogo, indexada por 'dono/repo' (chave_do_item).
+
+    De cada item guarda-se só uma impressão digital (hash do item inteiro + hash de cada
+    campo), não o item: o catálogo anterior custa poucos bytes por repositório, itens
+    inalterados comparam-se com uma única igualdade e só os alterados descem ao nível
+    dos campos. O catálogo novo é observado em fluxo, enquanto é gravado.
+    """
+    def __init__(self, anteriores: dict[str, tuple[str, dict[str, str]]] | None = None):
+        self.anteriores = anteriores or {}
+        self.atuais: dict[str, tuple[str, dict[str, str]]] = {}
+
+    @staticmethod
+    def _hash(valor) -> str:
+        texto = json.dumps(valor, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha1(texto.encode('utf-8')).hexdigest()[:16]
+
+    @classmethod
+    def impressao_digital(cls, item: dict) -> tuple[str, dict[str, str]]:
+        hashes_campos = {campo: cls._hash(valor) for campo, valor in item.items()}
+        return cls._hash(hashes_campos), hashes_campos
+
+    @classmethod
+    def de_itens(cls, itens: Iterable[dict]) -> 'ComparadorDeCatalogos':
+        """Comparador cujo 'antes' são estes itens (ex.: iterar_dados_json(ARQUIVO_SAIDA))."""
+        return cls({chave_do_item(item): cls.impressao_digital(item) for item in itens if isinstance(item, dict)})
+
+    def observar(self, itens: Iterable[dict]) -> Iterator[dict]:
+        """Repassa os itens, registando a impressão digital de cada um como 'depois'."""
+        for item in itens:
+            self.atuais[chave_do_item(item)] = self.impressao_digital(item)
+            yield item
+
+    def comparar(self) -> dict:
+        adicionados, alterados, inalterados = [], {}, 0
+        for repo, (hash_item, campos) in self.atuais.items():
+            anterior = self.anteriores.get(repo)
+            if anterior is None:
+                adicionados.append(repo)
+            elif anterior[0] == hash_item:
+                inalterados += 1
+            else:
+                campos_anteriores = anterior[1]
+                alterados[repo] = sorted(
+                    campo for campo in campos_anteriores.keys() | campos.keys()
+                    if campos_anteriores.get(campo) != campos.get(campo)
+                )
+        removidos = [repo for repo in self.anteriores if repo not in self.atuais]
+        return {'adicionados': adicionados, 'removidos': removidos, 'alterados': alterados, 'inalterados': inalterados}
+
+    @staticmethod
+    def imprimir_relatorio(relatorio: dict):
+        if not (relatorio['adicionados'] or relatorio['removidos'] or relatorio['alterados']):
+            print(f"Catálogo sem alterações ({relatorio['inalterados']} repositórios).")
+            return
+        print(f"Alterações no catálogo: {len(relatorio['adicionados'])} adicionados, "
+              f"{len(relatorio['removidos'])} removidos, {len(relatorio['alterados'])} alterados, "
+              f"{relatorio['inalterados']} inalterados")
+        for repo in relatorio['adicionados']:
+            print(f'  + {repo}')
+        for repo in relatorio['removidos']:
+            print(f'  - {repo}')
+        for repo, campos in relatorio['alterados'].items():
+            print(f"  ~ {repo}: {', '.join(campos)}")
+
+
 class GerenciadorDeRepositorios:
     """
     Orquestrador Principal.
     Conecta o Cliente API, o Processador Markdown e o Higienizador HTML.
     """
-    def __init__(self):
-        self.cliente_github = ClienteGithub(TOKEN_GITHUB)
+    BACKENDS_DISPONIVEIS = ('rest', 'graphql')
+
+    def __init__(self, manifesto: Optional[ManifestoIncremental] = None, backend: str = 'rest'):
+        if backend not in self.BACKENDS_DISPONIVEIS:
+            raise ValueError(f'Backend desconhecido: {backend} (opções: {", ".join(self.BACKENDS_DISPONIVEIS)})')
+        self.backend = backend
+        self.metricas = MetricasExecucao()
+        self.cache_negativo_readme = CacheNegativoReadme(ARQUIVO_CACHE_NEGATIVO_README)
+        self.cliente_github = ClienteGithub(
+            TOKEN_GITHUB,
+            cache=CacheHttp(DIRETORIO_CACHE_HTTP),
+            metricas=self.metricas,
+            cache_negativo=self.cache_negativo_readme,
+        )
         self.processador_md = ProcessadorMarkdown()
-        self.conversor_md = ConversorMarkdownHtml()
+        self.conversor_md = ConversorMarkdownHtml(TAMANHO_MEMO_CONVERSAO)
         self.higienizador = FormatadorHtml()
+        # Quando definido, READMEs inalterados reaproveitam o resultado da execução anterior
+        self.manifesto = manifesto
+        self.repos_reaproveitados: set[str] = set()
+        # Resultados obtidos em lote via GraphQL, indexados por (dono, repositorio)
+        self.dados_pre_carregados: dict[tuple[str, str], dict] = {}
+        # Último pushed_at e item gerado por repositório; permite saltar o README quando nada mudou
+        self.estado_por_repositorio: dict[str, dict] = {}
 
     def processar_repositorio_unico(self, url: str) -> dict | None:
         dono, nome_repositorio = ExtratorDeInformacoesUrl.extrair_dono_e_repositorio(url)
@@ -433,100 +1522,718 @@ class GerenciadorDeRepositorios:
             print(f'IGNORADO (URL inválida): {url}')
             return None
 
-        print(f'Processando: {dono}/{nome_repositorio} ...')
+        imprimir_linha(f'Processando: {dono}/{nome_repositorio} ...')
+        with self.metricas.repositorio(f'{dono}/{nome_repositorio}') as registo:
+            return self._buscar_e_processar(dono, nome_repositorio, registo)
+
+    def _buscar_e_processar(self, dono: str, nome_repositorio: str, registo: dict) -> dict:
+        nome_completo = f'{dono}/{nome_repositorio}'
         dados_saida = {
             'repo': nome_repositorio,
             'link': f'https://github.com/{dono}/{nome_repositorio}'
         }
 
+        # 0) Dados já obtidos em lote (backend GraphQL), quando disponíveis
+        pre_carregado = self.dados_pre_carregados.get((dono, nome_repositorio))
+
         # 1) Tenta metadados via API, mas não aborta em caso de falha
         branch_padrao = None
-        try:
-            info_api = self.cliente_github.buscar_metadados_repositorio(dono, nome_repositorio)
-            if isinstance(info_api, dict):
-                dados_saida['description'] = info_api.get('description') or ""
-                branch_padrao = info_api.get('default_branch')
-        except Exception as e:
-            print(f'  AVISO METADADOS: falha ao obter api.github.com ({e}). Prosseguindo com fallback raw...')
+        pushed_at = None
+        if pre_carregado:
+            dados_saida['description'] = pre_carregado['description']
+            branch_padrao = pre_carregado['default_branch']
+            pushed_at = pre_carregado.get('pushed_at')
+        else:
+            try:
+                with self.metricas.medir_etapa('metadados'):
+                    info_api = self.cliente_github.buscar_metadados_repositorio(dono, nome_repositorio)
+                if isinstance(info_api, dict):
+                    dados_saida['description'] = info_api.get('description') or ""
+                    branch_padrao = info_api.get('default_branch')
+                    pushed_at = info_api.get('pushed_at')
+            except Exception as e:
+                imprimir_linha(f'  AVISO METADADOS [{nome_completo}]: falha ao obter api.github.com ({e}). Prosseguindo com fallback raw...')
+
+        # Sem push desde a última passagem (modo contínuo): reaproveita o item inteiro
+        estado_anterior = self.estado_por_repositorio.get(nome_completo)
+        if pushed_at and estado_anterior and estado_anterior['pushed_at'] == pushed_at \
+                and estado_anterior['item'].get('description') == dados_saida.get('description'):
+            self.repos_reaproveitados.add(nome_repositorio)
+            registo['reaproveitado'] = True
+            if self.manifesto:
+                self.manifesto.manter_chave_anterior(nome_completo)
+            return estado_anterior['item']
 
         # 2) Tenta README (API primeiro; em falha, raw com heurísticas de branch/arquivo)
-        texto_readme = None
-        try:
-            texto_readme = self.cliente_github.buscar_readme(dono, nome_repositorio, branch_padrao)
-        except Exception as e:
-            print(f'  AVISO README: falha ao obter README ({e}).')
-
-        if texto_readme:
+        texto_readme = pre_carregado['readme'] if pre_carregado else None
+        if not texto_readme:
+            try:
+                with self.metricas.medir_etapa('readme'):
+                    texto_readme = self.cliente_github.buscar_readme(dono, nome_repositorio, branch_padrao)
+            except Exception as e:
+                imprimir_linha(f'  AVISO README [{nome_completo}]: falha ao obter README ({e}).')
+
+        item_anterior = None
+        if texto_readme and self.manifesto:
+            item_anterior = self.manifesto.obter_item_reaproveitavel(nome_completo, texto_readme)
+
+        if item_anterior is not None:
+            imprimir_linha(f'  README inalterado, reaproveitando HTML anterior de {nome_completo}')
+            dados_saida['title'] = item_anterior.get('title') or ""
+            dados_saida['description_html'] = item_anterior.get('description_html') or ""
+            self.repos_reaproveitados.add(nome_repositorio)
+            registo['reaproveitado'] = True
+        elif texto_readme:
             try:
                 # Extração e Limpeza Markdown
-                titulo, corpo_bruto = self.processador_md.extrair_titulo_e_corpo(texto_readme)
-                corpo_limpo = self.processador_md.limpar_corpo_bruto(corpo_bruto)
+                with self.metricas.medir_etapa('markdown'):
+                    titulo, corpo_bruto = self.processador_md.extrair_titulo_e_corpo(texto_readme)
+                    corpo_limpo = self.processador_md.limpar_corpo_bruto(corpo_bruto)
 
                 # Conversão para HTML
-                html_gerado = self.conversor_md.converter(corpo_limpo)
+                with self.metricas.medir_etapa('conversao'):
+                    html_gerado = self.conversor_md.converter(corpo_limpo)
 
                 # Higienização do HTML
-                html_final = self.higienizador.limpeza_final(html_gerado, nome_repositorio)
+                with self.metricas.medir_etapa('higienizacao'):
+                    html_final = self.higienizador.limpeza_final(html_gerado, nome_repositorio)
 
                 dados_saida['title'] = titulo or ""
                 dados_saida['description_html'] = html_final or ""
             except Exception as e:
-                print(f'  AVISO PROCESSAMENTO: falha ao processar README ({e}).')
+                imprimir_linha(f'  AVISO PROCESSAMENTO [{nome_completo}]: falha ao processar README ({e}).')
         else:
-            print(f'  AVISO: README não encontrado para {nome_repositorio}')
+            imprimir_linha(f'  AVISO: README não encontrado para {nome_completo}')
 
+        if pushed_at and 'description_html' in dados_saida:
+            self.estado_por_repositorio[nome_completo] = {'pushed_at': pushed_at, 'item': dados_saida}
         return dados_saida
 
-    def buscar_todos(self, lista_urls: list[str]) -> list[dict]:
-        resultados = []
+    def buscar_todos(self, lista_urls: list[str], maximo_em_voo: int = MAXIMO_REPOSITORIOS_EM_VOO) -> list[dict]:
+        return list(self.iterar_todos(lista_urls, maximo_em_voo))
+
+    def iterar_todos(self, lista_urls: list[str], maximo_em_voo: int = MAXIMO_REPOSITORIOS_EM_VOO) -> Iterator[dict]:
+        """
+        Processa os repositórios em paralelo (pool de threads limitado), entregando
+        cada item assim que ele e todos os anteriores estiverem prontos.
+        O ritmo global de requisições é controlado pelo LimitadorDeTaxa do cliente
+        e a ordem de saída respeita a ordem de lista_urls.
+        """
+        self.repos_reaproveitados.clear()
+        if self.backend == 'graphql':
+            self.pre_carregar_via_graphql(lista_urls)
+
+        if maximo_em_voo <= 1:
+            itens = (self.processar_repositorio_unico(url) for url in lista_urls)
+            yield from (item for item in itens if item)
+            return
+
+        with ThreadPoolExecutor(max_workers=maximo_em_voo) as executor:
+            for item in executor.map(self.processar_repositorio_unico, lista_urls):
+                if item:
+                    yield item
+
+    def resolver_fontes(self, configuracao: dict) -> list[str]:
+        """Resolve as fontes configuradas e guarda os metadados já obtidos na listagem."""
+        urls, metadados = DescobridorDeRepositorios(self.cliente_github).resolver(configuracao)
+        self.dados_pre_carregados.update(metadados)
+        return urls
+
+    def pre_carregar_via_graphql(self, lista_urls: list[str], tamanho_lote: int = TAMANHO_LOTE_GRAPHQL):
+        """
+        Obtém metadados e READMEs em lotes (uma query GraphQL por lote).
+        Repositórios que falharem ou não vierem no lote seguem pelo caminho REST normal.
+        """
+        if not self.cliente_github.autenticado:
+            print('AVISO GRAPHQL: a API GraphQL exige GITHUB_TOKEN. Usando backend REST.')
+            return
+
+        repositorios = []
         for url in lista_urls:
-            item = self.processar_repositorio_unico(url)
-            if item:
-                resultados.append(item)
-            time.sleep(TEMPO_PAUSA_ENTRE_REQUISICOES)
-        return resultados
+            dono, nome_repositorio = ExtratorDeInformacoesUrl.extrair_dono_e_repositorio(url)
+            if dono and nome_repositorio and (dono, nome_repositorio) not in repositorios:
+                repositorios.append((dono, nome_repositorio))
+
+        for inicio in range(0, len(repositorios), tamanho_lote):
+            lote = repositorios[inicio:inicio + tamanho_lote]
+            try:
+                with self.metricas.medir_etapa('graphql'):
+                    self.dados_pre_carregados.update(self.cliente_github.buscar_lote_graphql(lote))
+            except Exception as e:
+                print(f'  AVISO GRAPHQL: falha no lote de {len(lote)} repositórios ({e}). Usando REST para eles.')
 
     def reaplicar_limpeza_em_dados_existentes(self, dados: list[dict]) -> list[dict]:
         """Permite limpar o HTML novamente sem fazer fetch na API."""
+        for _ in self.reaplicar_limpeza_em_fluxo(dados):
+            pass
+        return dados
+
+    def reaplicar_limpeza_em_fluxo(self, itens: Iterable[dict], ignorar_repos: Iterable[str] = ()) -> Iterator[dict]:
+        """
+        Versão em fluxo de reaplicar_limpeza_em_dados_existentes: limpa e entrega um item
+        de cada vez. Repositórios em ignorar_repos passam sem nova limpeza.
+        """
         alterados = 0
-        for item in dados:
-            html_atual = item.get('description_html')
+        for item in itens:
             nome_repo = item.get('repo', '')
-            
-            novo_html = self.higienizador.limpeza_final(html_atual, nome_repo)
-            
-            if novo_html != html_atual:
-                item['description_html'] = novo_html
-                alterados += 1
-        
+            if nome_repo not in ignorar_repos:
+                html_atual = item.get('description_html')
+                novo_html = self.higienizador.limpeza_final(html_atual, nome_repo)
+
+                if novo_html != html_atual:
+                    item['description_html'] = novo_html
+                    alterados += 1
+            yield item
+
         print(f'Limpeza local aplicada. {alterados} registros modificados.')
-        return dados
+
+    def reaplicar_limpeza_em_paralelo(self, itens: Iterable[dict], processos: int | None = None,
+                                      tamanho_lote: int = TAMANHO_LOTE_PROCESSOS) -> Iterator[dict]:
+        """
+        Re-higienização em lote distribuída por um pool de processos (trabalho só de CPU).
+        Os itens são lidos em janelas e enviados aos processos em lotes de tamanho_lote;
+        a ordem de saída é preservada e cada item alterado é reportado com o seu diff.
+        """
+        # Importado aqui: multiprocessing custa ~25 ms no arranque e só este caminho o usa
+        from concurrent.futures import ProcessPoolExecutor
+        processos = processos or os.cpu_count() or 1
+        iterador = iter(itens)
+        alterados = 0
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            while janela := list(itertools.islice(iterador, processos * tamanho_lote * 4)):
+                entradas = [(item.get('description_html'), item.get('repo', '')) for item in janela]
+                resultados = executor.map(_limpar_html_em_processo, entradas, chunksize=tamanho_lote)
+                for item, (novo_html, linhas_removidas, linhas_adicionadas) in zip(janela, resultados):
+                    if novo_html != item.get('description_html'):
+                        item['description_html'] = novo_html
+                        alterados += 1
+                        print(f"  ~ {item.get('repo', '')}: -{linhas_removidas} +{linhas_adicionadas} linhas")
+                    yield item
+
+        print(f'Limpeza local aplicada. {alterados} registros modificados.')
+
+_FORMATADOR_DO_PROCESSO: FormatadorHtml | None = None
+
+def _limpar_html_em_processo(entrada: tuple[str | None, str]) -> tuple[str, int, int]:
+    """Executada nos processos do pool: devolve o novo HTML e as linhas removidas/adicionadas."""
+    global _FORMATADOR_DO_PROCESSO
+    if _FORMATADOR_DO_PROCESSO is None:
+        _FORMATADOR_DO_PROCESSO = FormatadorHtml()
+    html_atual, nome_repo = entrada
+    novo_html = _FORMATADOR_DO_PROCESSO.limpeza_final(html_atual, nome_repo)
+    if novo_html == html_atual:
+        return novo_html, 0, 0
+    removidas = adicionadas = 0
+    for linha in difflib.unified_diff((html_atual or '').splitlines(), novo_html.splitlines(), lineterm='', n=0):
+        if linha.startswith('-') and not linha.startswith('---'):
+            removidas += 1
+        elif linha.startswith('+') and not linha.startswith('+++'):
+            adicionadas += 1
+    return novo_html, removidas, adicionadas
+
+def iterar_dados_json(arquivo: Path = ARQUIVO_SAIDA, tamanho_bloco: int = 64 * 1024) -> Iterator[dict]:
+    """
+    Lê o array JSON de projetos item a item, sem carregar o ficheiro inteiro em memória.
+    Aceita exatamente o que json.load aceitaria para um array (itens separados por uma
+    vírgula, sem vírgula final nem conteúdo após o ']'). Lança json.JSONDecodeError se o
+    conteúdo estiver malformado.
+    """
+    decodificador = json.JSONDecoder()
+    with open(arquivo, 'r', encoding='utf-8') as f:
+        buffer = f.read(tamanho_bloco).lstrip()
+        if not buffer.startswith('['):
+            raise json.JSONDecodeError('Esperado array JSON', buffer, 0)
+        buffer = buffer[1:]
+        fim_arquivo = False
+        # 'valor' = espera um item (ou ']' se o array estiver vazio); 'separador' = espera ',' ou ']'
+        estado = 'valor'
+        primeiro = True
+
+        while True:
+            buffer = buffer.lstrip()
+            if not buffer and not fim_arquivo:
+                bloco = f.read(tamanho_bloco)
+                fim_arquivo = not bloco
+                buffer = bloco
+                continue
+            if buffer.startswith(']') and (estado == 'separador' or primeiro):
+                if (buffer[1:] + f.read()).strip():
+                    raise json.JSONDecodeError('Conteúdo extra após o fim do array', buffer, 1)
+                return
+            if estado == 'separador':
+                if not buffer.startswith(','):
+                    raise json.JSONDecodeError('Esperado "," ou "]" entre itens', buffer, 0)
+                buffer = buffer[1:]
+                estado = 'valor'
+                continue
+            try:
+                item, fim = decodificador.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if fim_arquivo:
+                    raise
+                bloco = f.read(tamanho_bloco)
+                fim_arquivo = not bloco
+                buffer += bloco
+                continue
+            # Um número cortado entre dois blocos descodifica como prefixo ('1.' → 1, '-25e' → -25):
+            # o valor só é aceite se depois dele vier um carácter que não pode continuar um número,
+            # ou no fim do ficheiro
+            if not fim_arquivo and (fim == len(buffer) or buffer[fim] in '0123456789.eE+-'):
+                bloco = f.read(tamanho_bloco)
+                fim_arquivo = not bloco
+                buffer += bloco
+                continue
+            yield item
+            buffer = buffer[fim:]
+            estado = 'separador'
+            primeiro = False
 
 def carregar_dados_json() -> list[dict]:
     if not ARQUIVO_SAIDA.exists():
         return []
     try:
-        return json.loads(ARQUIVO_SAIDA.read_text(encoding='utf-8'))
+        return list(iterar_dados_json())
     except json.JSONDecodeError:
         return []
 
-def salvar_dados_json(dados: list[dict]):
-    DIRETORIO_SAIDA.mkdir(parents=True, exist_ok=True)
-    ARQUIVO_SAIDA.write_text(json.dumps(dados, ensure_ascii=False, indent=2), encoding='utf-8')
-    print(f'Dados salvos com sucesso em: {ARQUIVO_SAIDA} ({len(dados)} itens)')
+def salvar_dados_json(dados: Iterable[dict], compacto: bool = False, arquivo: Path = ARQUIVO_SAIDA,
+                      somente_se_mudou: bool = False) -> int:
+    """
+    Escreve os itens em fluxo (um de cada vez) num ficheiro temporário e
+    substitui o destino de forma atómica no fim. Aceita listas ou geradores.
+    No modo compacto o JSON é gerado sem indentação. Com somente_se_mudou=True
+    o destino só é substituído se o conteúdo for diferente. Retorna o número de itens.
+    """
+    arquivo.parent.mkdir(parents=True, exist_ok=True)
+    temporario = arquivo.with_name(f'.{arquivo.name}.{os.getpid()}.tmp')
+    total = 0
+    try:
+        with open(temporario, 'w', encoding='utf-8') as f:
+            f.write('[')
+            for item in dados:
+                if compacto:
+                    f.write(',' if total else '')
+                    f.write(json.dumps(item, ensure_ascii=False, separators=(',', ':')))
+                else:
+                    # Mesmo formato que json.dumps(lista, indent=2)
+                    f.write(',\n  ' if total else '\n  ')
+                    f.write(json.dumps(item, ensure_ascii=False, indent=2).replace('\n', '\n  '))
+                total += 1
+            f.write('\n]' if total and not compacto else ']')
+        if somente_se_mudou and arquivo.exists() and filecmp.cmp(temporario, arquivo, shallow=False):
+            temporario.unlink()
+            print(f'Sem alterações em: {arquivo} ({total} itens)')
+            return total
+        os.replace(temporario, arquivo)
+    except BaseException:
+        temporario.unlink(missing_ok=True)
+        raise
+    print(f'Dados salvos com sucesso em: {arquivo} ({total} itens)')
+    return total
+
+def extrair_excerto_texto(html: str, limite: int = TAMANHO_EXCERTO_INDICE) -> str:
+    """Texto plano do HTML (sem tags, entidades resolvidas, espaços colapsados), cortado em `limite` (+ '...')."""
+    texto = re.sub(r'<(script|style)\b[^>]*>[\s\S]*?</\1>|<[^>]+>', ' ', html, flags=re.IGNORECASE)
+    texto = re.sub(r'\s+', ' ', unescape(texto)).strip()
+    return texto if len(texto) <= limite else texto[:limite].rstrip() + '...'
+
+def salvar_dados_fragmentados(dados: Iterable[dict], compacto: bool = False, minificar: bool = True) -> int:
+    """
+    Gera a saída fragmentada: um índice sem description_html e um ficheiro .html por projeto.
+    Itens sem 'description' levam no índice um 'excerpt' em texto plano, para o card não ficar vazio.
+    O nome de cada fragmento inclui o hash do conteúdo (ex.: projetos/Repo.1a2b3c4d5e6f.html),
+    permitindo cache de longa duração. Fragmentos antigos não referenciados são removidos.
+    Com minificar=True os fragmentos passam pelo MinificadorHtml (o JSON completo fica intacto,
+    pois a limpeza local trabalha linha a linha sobre ele).
+    """
+    DIRETORIO_HTML_PROJETOS.mkdir(parents=True, exist_ok=True)
+    minificador = MinificadorHtml()
+    fragmentos_em_uso = set()
+
+    def _itens_indice():
+        for item in dados:
+            item_indice = {chave: valor for chave, valor in item.items() if chave != 'description_html'}
+            html = item.get('description_html')
+            if html and minificar:
+                html = minificador.minificar(html)
+            if html:
+                hash_conteudo = hashlib.sha256(html.encode('utf-8')).hexdigest()[:12]
+                nome_fragmento = f"{re.sub(r'[^A-Za-z0-9._-]', '_', item.get('repo', 'projeto'))}.{hash_conteudo}.html"
+                arquivo_fragmento = DIRETORIO_HTML_PROJETOS / nome_fragmento
+                conteudo = html.encode('utf-8')
+                # O nome já traz o hash: só se escreve se faltar ou tiver outro tamanho (escrita
+                # interrompida antes desta versão); a escrita é atómica, como a dos outros artefatos
+                if not arquivo_fragmento.exists() or arquivo_fragmento.stat().st_size != len(conteudo):
+                    temporario = arquivo_fragmento.with_name(f'.{nome_fragmento}.{os.getpid()}.tmp')
+                    try:
+                        temporario.write_bytes(conteudo)
+                        os.replace(temporario, arquivo_fragmento)
+                    except BaseException:
+                        temporario.unlink(missing_ok=True)
+                        raise
+                fragmentos_em_uso.add(nome_fragmento)
+                item_indice['html_file'] = f'{DIRETORIO_HTML_PROJETOS.name}/{nome_fragmento}'
+                if not (item.get('description') or '').strip():
+                    excerto = extrair_excerto_texto(html)
+                    if excerto:
+                        item_indice['excerpt'] = excerto
+            yield item_indice
+
+    total = salvar_dados_json(_itens_indice(), compacto, arquivo=ARQUIVO_INDICE)
+
+    for arquivo_antigo in DIRETORIO_HTML_PROJETOS.iterdir():
+        nome_base = arquivo_antigo.name.removesuffix('.gz').removesuffix('.br')
+        if nome_base not in fragmentos_em_uso:
+            arquivo_antigo.unlink()
+    return total
+
+def gerar_artefatos_comprimidos(arquivos: Iterable[Path], usar_brotli: bool = True) -> list[dict]:
+    """
+    Escreve, ao lado de cada arquivo, uma versão .gz (e .br, se o pacote brotli existir)
+    para servidores estáticos que servem ficheiros pré-comprimidos.
+    Irmãos já atualizados não são reescritos. Retorna o tamanho de cada variante.
+    """
+    compressor_brotli = None
+    if usar_brotli:
+        try:
+            import brotli
+            compressor_brotli = lambda dados: brotli.compress(dados, quality=11)
+        except ImportError:
+            print('AVISO: pacote "brotli" não instalado; gerando apenas .gz.')
+
+    relatorio = []
+    for arquivo in arquivos:
+        conteudo = arquivo.read_bytes()
+        linha = {'arquivo': arquivo, 'original': len(conteudo)}
+        variantes = [('gz', lambda dados: gzip.compress(dados, compresslevel=9, mtime=0))]
+        if compressor_brotli:
+            variantes.append(('br', compressor_brotli))
+        for extensao, comprimir in variantes:
+            irmao = arquivo.with_name(f'{arquivo.name}.{extensao}')
+            if irmao.exists() and irmao.stat().st_mtime >= arquivo.stat().st_mtime:
+                linha[extensao] = irmao.stat().st_size
+                continue
+            comprimido = comprimir(conteudo)
+            irmao.write_bytes(comprimido)
+            linha[extensao] = len(comprimido)
+        relatorio.append(linha)
+    return relatorio
+
+def imprimir_relatorio_tamanhos(relatorio: list[dict]):
+    print(f'{"Arquivo":<60} {"original":>10} {"gzip":>10} {"brotli":>10}')
+    for linha in relatorio:
+        nome = str(linha['arquivo'].relative_to(DIRETORIO_RAIZ)) if linha['arquivo'].is_relative_to(DIRETORIO_RAIZ) else str(linha['arquivo'])
+        brotli_tamanho = linha.get('br', '-')
+        print(f'{nome:<60} {linha["original"]:>10} {linha["gz"]:>10} {brotli_tamanho:>10}')
+
+def pos_processar_saida(compacto: bool = False):
+    """Etapa final após salvar_dados_json: saída fragmentada minificada e artefatos pré-comprimidos."""
+    publicados = [ARQUIVO_SAIDA]
+    if GERAR_SAIDA_FRAGMENTADA:
+        salvar_dados_fragmentados(iterar_dados_json(), compacto)
+        publicados.append(ARQUIVO_INDICE)
+        publicados.extend(sorted(DIRETORIO_HTML_PROJETOS.glob('*.html')))
+    if GERAR_ARTEFATOS_COMPRIMIDOS:
+        imprimir_relatorio_tamanhos(gerar_artefatos_comprimidos(publicados))
+
+def limpar_arquivo_existente(compacto: bool = False, processos: int = 1):
+    """
+    Reaplica a limpeza ao ficheiro de dados atual, lendo e escrevendo em fluxo.
+    Com processos > 1 a re-higienização é distribuída por um pool de processos.
+    """
+    if not ARQUIVO_SAIDA.exists():
+        print(f'Nada a limpar: {ARQUIVO_SAIDA} não existe.')
+        return
+    gerente = GerenciadorDeRepositorios()
+    comparador = ComparadorDeCatalogos.de_itens(iterar_dados_json())
+    if processos > 1:
+        itens = gerente.reaplicar_limpeza_em_paralelo(iterar_dados_json(), processos)
+    else:
+        itens = gerente.reaplicar_limpeza_em_fluxo(iterar_dados_json())
+    salvar_dados_json(comparador.observar(ValidadorDeEsquema(ESQUEMA_ITEM_CATALOGO).validar_em_fluxo(itens)), compacto)
+    comparador.imprimir_relatorio(comparador.comparar())
+    pos_processar_saida(compacto)
+
+def calcular_hash_arquivo(arquivo: Path) -> str | None:
+    if not arquivo.exists():
+        return None
+    with open(arquivo, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+def executar_modo_continuo(configuracao_fontes: dict, intervalo_segundos: float = INTERVALO_MODO_CONTINUO_SEGUNDOS,
+                           maximo_ciclos: int | None = None):
+    """
+    Modo daemon: mantém o mesmo GerenciadorDeRepositorios (sessão HTTP, caches e conversor
+    aquecidos) e refaz a busca a cada intervalo. Repositórios sem novo push (pushed_at/ETag)
+    não voltam a processar o README, e o ficheiro só é reescrito quando o conteúdo muda.
+    """
+    manifesto = ManifestoIncremental(ARQUIVO_MANIFESTO, carregar_dados_json())
+    gerente = GerenciadorDeRepositorios(manifesto, backend=BACKEND_PADRAO)
+    validador = ValidadorDeEsquema(ESQUEMA_ITEM_CATALOGO)
+    ciclo = 0
+    try:
+        while maximo_ciclos is None or ciclo < maximo_ciclos:
+            ciclo += 1
+            inicio = time.monotonic()
+            gerente.metricas = gerente.cliente_github.metricas = MetricasExecucao()
+            # Fontes resolvidas a cada ciclo: apanha repositórios novos dos utilizadores configurados
+            gerente.dados_pre_carregados.clear()
+            lista_urls = gerente.resolver_fontes(configuracao_fontes)
+            print(f'[modo contínuo] Ciclo {ciclo}: verificando {len(lista_urls)} repositórios...')
+
+            hash_antes = calcular_hash_arquivo(ARQUIVO_SAIDA)
+            comparador = ComparadorDeCatalogos.de_itens(iterar_dados_json()) if hash_antes else ComparadorDeCatalogos()
+            itens = gerente.iterar_todos(lista_urls)
+            itens = list(gerente.reaplicar_limpeza_em_fluxo(itens, ignorar_repos=gerente.repos_reaproveitados))
+            try:
+                salvar_dados_json(comparador.observar(validador.validar_em_fluxo(itens)), somente_se_mudou=True)
+            except ErroEsquemaCatalogo as e:
+                print(f'[modo contínuo] ERRO: {e}. Catálogo anterior mantido.')
+                manifesto.descartar_execucao()
+            else:
+                if calcular_hash_arquivo(ARQUIVO_SAIDA) != hash_antes:
+                    comparador.imprimir_relatorio(comparador.comparar())
+                    pos_processar_saida()
+                    manifesto.salvar()
+                manifesto.avancar_execucao(itens)
+            gerente.cache_negativo_readme.salvar()
+            gerente.metricas.imprimir_resumo(gerente.metricas.salvar_relatorio())
+
+            if maximo_ciclos is not None and ciclo >= maximo_ciclos:
+                break
+            time.sleep(max(0.0, intervalo_segundos - (time.monotonic() - inicio)))
+    except KeyboardInterrupt:
+        print('[modo contínuo] Interrompido pelo utilizador.')
 
-def configurar_argumentos_cli():
-    # Mantido por compatibilidade, mas parâmetros são ignorados.
-    return argparse.Namespace()
+def validar_arquivo_existente() -> list[str]:
+    """
+    Verificação offline dos artefactos publicados: catálogo e índice respeitam os esquemas,
+    cada item tem um 'dono/repo' (e um nome) único, o índice acompanha o catálogo e cada fragmento HTML existe
+    e corresponde ao hash que tem no nome. Devolve a lista de problemas (vazia se estiver tudo certo).
+    """
+    if not ARQUIVO_SAIDA.exists():
+        return [f'{ARQUIVO_SAIDA} não existe.']
+    problemas = []
+    chaves = []
+    donos_por_nome: dict[str, str] = {}
+    validador = ValidadorDeEsquema(ESQUEMA_ITEM_CATALOGO)
+    try:
+        for posicao, item in enumerate(iterar_dados_json()):
+            problemas.extend(f'{ARQUIVO_SAIDA.name}{erro}' for erro in validador.validar(item, caminho=f'[{posicao}]'))
+            repo = item.get('repo') if isinstance(item, dict) else None
+            if not isinstance(repo, str) or not repo:
+                problemas.append(f'Item {posicao}: campo "repo" ausente ou inválido.')
+                continue
+            chave = chave_do_item(item)
+            if chave in chaves:
+                problemas.append(f'Item {posicao}: repositório duplicado "{chave}".')
+            elif repo.lower() in donos_por_nome:
+                # O site identifica os projetos só pelo nome: donos diferentes não podem partilhá-lo
+                problemas.append(f'Item {posicao}: nome "{repo}" de {chave} já usado por {donos_por_nome[repo.lower()]}.')
+            else:
+                donos_por_nome[repo.lower()] = chave
+            chaves.append(chave)
+    except (json.JSONDecodeError, ValueError) as e:
+        return [f'{ARQUIVO_SAIDA.name} ilegível: {e}']
+
+    if GERAR_SAIDA_FRAGMENTADA and ARQUIVO_INDICE.exists():
+        try:
+            indice = list(iterar_dados_json(ARQUIVO_INDICE))
+        except (json.JSONDecodeError, ValueError) as e:
+            return problemas + [f'{ARQUIVO_INDICE.name} ilegível: {e}']
+        validador_indice = ValidadorDeEsquema(ESQUEMA_ITEM_INDICE)
+        for posicao, item in enumerate(indice):
+            problemas.extend(f'{ARQUIVO_INDICE.name}{erro}' for erro in validador_indice.validar(item, caminho=f'[{posicao}]'))
+        indice = [item for item in indice if isinstance(item, dict)]
+        if [chave_do_item(item) for item in indice] != chaves:
+            problemas.append(f'{ARQUIVO_INDICE.name} não acompanha {ARQUIVO_SAIDA.name} (repositórios ou ordem diferentes).')
+        for item in indice:
+            if not item.get('html_file'):
+                continue
+            arquivo_fragmento = DIRETORIO_SAIDA / item['html_file']
+            if not arquivo_fragmento.exists():
+                problemas.append(f"{item.get('repo')}: fragmento {item['html_file']} não existe.")
+                continue
+            hash_nome = arquivo_fragmento.name.rsplit('.', 2)[-2]
+            if hashlib.sha256(arquivo_fragmento.read_bytes()).hexdigest()[:12] != hash_nome:
+                problemas.append(f"{item.get('repo')}: conteúdo de {item['html_file']} não corresponde ao hash do nome.")
+    return problemas
+
+def montar_catalogo_colunar(itens: Iterable[dict]) -> dict:
+    """
+    Layout colunar: uma lista de valores por campo, alinhadas por posição (null onde o item
+    não tem o campo). Os nomes dos campos aparecem uma só vez e cada coluna é homogénea.
+    """
+    colunas: dict[str, list] = {}
+    total = 0
+    for item in itens:
+        for campo in item:
+            if campo not in colunas:
+                colunas[campo] = [None] * total
+        for campo, valores in colunas.items():
+            valores.append(item.get(campo))
+        total += 1
+    return {'formato': 'colunar', 'versao': 1, 'total': total, 'colunas': colunas}
+
+def exportar_catalogo_compacto(formato: str = 'colunar', arquivo: Path | None = None) -> Path | None:
+    """
+    Exporta o catálogo em layout colunar como JSON compacto ou MessagePack (este último só
+    se o pacote 'msgpack' estiver instalado). Escrita atómica; devolve o ficheiro escrito.
+    """
+    catalogo = montar_catalogo_colunar(iterar_dados_json())
+    if formato == 'msgpack':
+        try:
+            import msgpack
+        except ImportError:
+            print('ERRO: pacote "msgpack" não instalado (pip install msgpack); use --formato colunar.')
+            return None
+        conteudo = msgpack.packb(catalogo, use_bin_type=True)
+        arquivo = arquivo or ARQUIVO_EXPORTACAO_MSGPACK
+    else:
+        conteudo = json.dumps(catalogo, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        arquivo = arquivo or ARQUIVO_EXPORTACAO_COLUNAR
+
+    arquivo.parent.mkdir(parents=True, exist_ok=True)
+    temporario = arquivo.with_name(f'.{arquivo.name}.{os.getpid()}.tmp')
+    temporario.write_bytes(conteudo)
+    os.replace(temporario, arquivo)
+    print(f'Exportado {catalogo["total"]} itens para {arquivo} '
+          f'({len(conteudo)} bytes; original {ARQUIVO_SAIDA.stat().st_size} bytes)')
+    return arquivo
+
+def comparar_arquivos_catalogo(arquivo_anterior: Path, arquivo_atual: Path = ARQUIVO_SAIDA) -> dict:
+    """Diferença por 'repo' entre dois ficheiros de catálogo, ambos lidos em fluxo."""
+    comparador = ComparadorDeCatalogos.de_itens(iterar_dados_json(arquivo_anterior))
+    for _ in comparador.observar(iterar_dados_json(arquivo_atual)):
+        pass
+    return comparador.comparar()
+
+def _adicionar_argumentos_fontes(parser: argparse.ArgumentParser):
+    fontes = parser.add_argument_group('fontes de repositórios')
+    fontes.add_argument('--config', type=Path,
+                        help=f'Ficheiro JSON de fontes (padrão: {ARQUIVO_CONFIGURACAO_FONTES.name}, se existir).')
+    fontes.add_argument('--repositorio', action='append', default=[], metavar='URL',
+                        help='URL de um repositório (pode repetir).')
+    fontes.add_argument('--utilizador', action='append', default=[], metavar='NOME',
+                        help='Utilizador ou organização cujos repositórios são todos incluídos (pode repetir).')
+    fontes.add_argument('--topico', action='append', default=[],
+                        help='Com --utilizador: só repositórios com algum destes tópicos (pode repetir).')
+    fontes.add_argument('--incluir-forks', action='store_true',
+                        help='Com --utilizador: inclui forks.')
+    fontes.add_argument('--alterado-desde', metavar='AAAA-MM-DD',
+                        help='Com --utilizador: só repositórios com push a partir desta data.')
+
+COMANDO_PADRAO = 'buscar'
+# Opções antigas (antes dos subcomandos) continuam a funcionar
+OPCOES_LEGADAS = {'--continuo': 'continuo', '--limpar-local': 'limpar'}
+
+def _normalizar_argumentos_legados(argv: list[str]) -> list[str]:
+    """Converte '--limpar-local ...' em 'limpar ...' e usa 'buscar' quando não há subcomando."""
+    for opcao, comando in OPCOES_LEGADAS.items():
+        if opcao in argv:
+            return [comando] + [a for a in argv if a != opcao]
+    if not argv or (argv[0].startswith('-') and argv[0] not in ('-h', '--help')):
+        return [COMANDO_PADRAO] + argv
+    return argv
+
+def configurar_argumentos_cli(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description='Gera data/github_projects.json a partir dos repositórios do GitHub.')
+    comandos = parser.add_subparsers(dest='comando', metavar='{buscar,continuo,limpar,validar,comparar,exportar}')
+
+    buscar = comandos.add_parser('buscar', help='(padrão) Busca, limpa e substitui o catálogo.')
+    _adicionar_argumentos_fontes(buscar)
+
+    continuo = comandos.add_parser('continuo', help='Mantém o processo ativo e atualiza o catálogo periodicamente.')
+    continuo.add_argument('--intervalo', type=float, default=INTERVALO_MODO_CONTINUO_SEGUNDOS,
+                          help='Segundos entre ciclos.')
+    _adicionar_argumentos_fontes(continuo)
+
+    limpar = comandos.add_parser('limpar', help='Sem rede: reaplica a limpeza ao ficheiro de dados existente.')
+    limpar.add_argument('--processos', type=int, default=1,
+                        help='Processos usados na re-higienização (0 = todos os núcleos).')
+
+    comandos.add_parser('validar', help='Sem rede: verifica o catálogo, o índice e os fragmentos publicados.')
+
+    comparar = comandos.add_parser('comparar', help='Sem rede: repositórios e campos que mudaram entre dois catálogos.')
+    comparar.add_argument('anterior', type=Path, help='Catálogo antigo (ex.: extraído com git show).')
+    comparar.add_argument('atual', type=Path, nargs='?', default=ARQUIVO_SAIDA,
+                          help=f'Catálogo novo (padrão: {ARQUIVO_SAIDA.name}).')
+    comparar.add_argument('--json', action='store_true', help='Imprime o relatório em JSON.')
+
+    exportar = comandos.add_parser('exportar', help='Sem rede: exporta o catálogo em formato compacto.')
+    exportar.add_argument('--formato', choices=('colunar', 'msgpack'), default='colunar',
+                          help='colunar = JSON colunar compacto; msgpack = mesmo layout em MessagePack.')
+    exportar.add_argument('--saida', type=Path, help='Ficheiro de destino.')
+
+    return parser.parse_args(_normalizar_argumentos_legados(list(sys.argv[1:] if argv is None else argv)))
+
+def obter_configuracao_fontes(argumentos: argparse.Namespace) -> dict:
+    """
+    Prioridade: argumentos de linha de comandos > ficheiro de configuração > LISTA_URLS_REPOSITORIOS.
+    """
+    if argumentos.repositorio or argumentos.utilizador:
+        filtro = {
+            'topicos': argumentos.topico,
+            'incluir_forks': argumentos.incluir_forks,
+            'alterado_desde': argumentos.alterado_desde,
+        }
+        return {
+            'repositorios': argumentos.repositorio,
+            'utilizadores': [{'nome': nome, **filtro} for nome in argumentos.utilizador],
+        }
+    arquivo = argumentos.config or ARQUIVO_CONFIGURACAO_FONTES
+    if argumentos.config or arquivo.exists():
+        return DescobridorDeRepositorios.carregar_configuracao(arquivo)
+    return {'repositorios': LISTA_URLS_REPOSITORIOS}
+
+def main() -> int:
+    argumentos = configurar_argumentos_cli()
+    if argumentos.comando == 'limpar':
+        limpar_arquivo_existente(processos=argumentos.processos or os.cpu_count() or 1)
+        return 0
+    if argumentos.comando == 'validar':
+        problemas = validar_arquivo_existente()
+        for problema in problemas:
+            print(f'ERRO: {problema}')
+        if not problemas:
+            print(f'{ARQUIVO_SAIDA.name}: sem problemas.')
+        return 1 if problemas else 0
+    if argumentos.comando == 'comparar':
+        relatorio = comparar_arquivos_catalogo(argumentos.anterior, argumentos.atual)
+        if argumentos.json:
+            print(json.dumps(relatorio, ensure_ascii=False, indent=2))
+        else:
+            ComparadorDeCatalogos.imprimir_relatorio(relatorio)
+        return 0
+    if argumentos.comando == 'exportar':
+        return 0 if exportar_catalogo_compacto(argumentos.formato, argumentos.saida) else 1
+    configuracao_fontes = obter_configuracao_fontes(argumentos)
+    if argumentos.comando == 'continuo':
+        executar_modo_continuo(configuracao_fontes, argumentos.intervalo)
+        return 0
 
-def main():
     # Sem parâmetros: por padrão BUSCA, LIMPA e SUBSTITUI o ficheiro existente.
-    gerente = GerenciadorDeRepositorios()
+    dados_anteriores = carregar_dados_json()
+    manifesto = ManifestoIncremental(ARQUIVO_MANIFESTO, dados_anteriores)
+    comparador = ComparadorDeCatalogos.de_itens(dados_anteriores)
+    gerente = GerenciadorDeRepositorios(manifesto, backend=BACKEND_PADRAO)
     print("Buscando dados da API do GitHub...")
-    dados = gerente.buscar_todos(LISTA_URLS_REPOSITORIOS)
-    # Passada final de limpeza e normalização
-    dados = gerente.reaplicar_limpeza_em_dados_existentes(dados)
-    salvar_dados_json(dados)
+    lista_urls = gerente.resolver_fontes(configuracao_fontes)
+    itens = gerente.iterar_todos(lista_urls)
+    # Passada final de limpeza e normalização (itens reaproveitados já passaram por ela)
+    itens = gerente.reaplicar_limpeza_em_fluxo(itens, ignorar_repos=gerente.repos_reaproveitados)
+    # Validação e diferença em fluxo; um item fora do esquema mantém o catálogo anterior
+    try:
+        salvar_dados_json(comparador.observar(ValidadorDeEsquema(ESQUEMA_ITEM_CATALOGO).validar_em_fluxo(itens)))
+    except ErroEsquemaCatalogo as e:
+        print(f'ERRO: {e}. Catálogo anterior mantido.')
+        return 1
+    comparador.imprimir_relatorio(comparador.comparar())
+    pos_processar_saida()
+    manifesto.salvar()
+    gerente.cache_negativo_readme.salvar()
+    gerente.metricas.imprimir_resumo(gerente.metricas.salvar_relatorio())
+    return 0
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Etapa de imagens: gera variantes redimensionadas (AVIF/WebP) das capturas de ecrã em
+assets/projetos e regista dimensões e srcset em
+data/imagens_responsivas.json, que o script.js usa para servir a largura adequada a cada ecrã.
+
+- Cada imagem de origem é identificada pelo hash do conteúdo; se o hash e a configuração
+  (larguras/formatos/qualidade) não mudaram e as variantes existem, a imagem é saltada.
+- As imagens alteradas são processadas em paralelo (ProcessPoolExecutor: codificar
+  AVIF/WebP é trabalho de CPU).
+- Requer o Pillow (em requirements.txt). AVIF só é gerado se o Pillow tiver suporte
+  (Pillow >= 11.3 ou o plugin pillow-avif-plugin); caso contrário só se gera WebP.
+
+Uso:
+    python scripts/imagens_responsivas.py [--processos N] [--forcar]
+"""
+import os
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+DIRETORIO_RAIZ = Path(__file__).resolve().parent.parent
+DIRETORIO_ASSETS = DIRETORIO_RAIZ / 'assets'
+# Origens: só as capturas dos projetos, que o script.js serve com srcset/<picture>
+# (a foto de perfil é usada diretamente pelo index.html e já tem o tamanho final)
+ORIGENS_IMAGENS = [DIRETORIO_ASSETS / 'projetos']
+EXTENSOES_ORIGEM = ('.webp', '.png', '.jpg', '.jpeg')
+DIRETORIO_VARIANTES = DIRETORIO_ASSETS / 'responsivas'
+ARQUIVO_MAPA_IMAGENS = DIRETORIO_RAIZ / 'data' / 'imagens_responsivas.json'
+
+# Larguras geradas (nunca se amplia: só entram as menores que a original, mais a original)
+LARGURAS_VARIANTES = (320, 640, 960, 1280)
+# Ordem = preferência no <picture> (o primeiro formato suportado pelo navegador ganha)
+OPCOES_FORMATOS = {
+    'avif': {'quality': 50, 'speed': 6},
+    'webp': {'quality': 78, 'method': 6},
+}
+
+
+def _url_publica(caminho: Path) -> str:
+    return '/' + caminho.relative_to(DIRETORIO_RAIZ).as_posix()
+
+
+def _versao_configuracao(formatos: list[str]) -> str:
+    """Muda sempre que larguras, formatos ou opções de codificação mudam (invalida tudo)."""
+    configuracao = {'larguras': LARGURAS_VARIANTES, 'formatos': {f: OPCOES_FORMATOS[f] for f in formatos}}
+    return hashlib.sha256(json.dumps(configuracao, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def formatos_disponiveis() -> list[str]:
+    """Formatos que o Pillow instalado consegue escrever, pela ordem de OPCOES_FORMATOS."""
+    from PIL import features
+    return [formato for formato in OPCOES_FORMATOS if features.check(formato)]
+
+
+def listar_imagens_origem() -> list[Path]:
+    imagens = []
+    for origem in ORIGENS_IMAGENS:
+        if origem.is_file():
+            imagens.append(origem)
+        elif origem.is_dir():
+            imagens.extend(a for a in origem.rglob('*') if a.suffix.lower() in EXTENSOES_ORIGEM)
+    return sorted(imagens)
+
+
+def _gerar_variantes_em_processo(caminho_origem: str, formatos: list[str]) -> dict:
+    """
+    Executado num processo filho: abre a imagem uma vez e escreve todas as variantes.
+    Cada ficheiro é escrito num temporário e movido com os.replace (nunca fica meio escrito).
+    """
+    from PIL import Image
+
+    origem = Path(caminho_origem)
+    relativo = origem.relative_to(DIRETORIO_ASSETS).with_suffix('')
+    with Image.open(origem) as imagem:
+        imagem.load()
+        largura_original, altura_original = imagem.size
+        if imagem.mode not in ('RGB', 'RGBA'):
+            imagem = imagem.convert('RGBA' if 'A' in imagem.getbands() else 'RGB')
+
+        larguras = sorted({l for l in LARGURAS_VARIANTES if l < largura_original} | {largura_original})
+        variantes = []
+        for largura in larguras:
+            altura = max(1, round(altura_original * largura / largura_original))
+            redimensionada = imagem if largura == largura_original else imagem.resize((largura, altura), Image.LANCZOS)
+            for formato in formatos:
+                # WebP na largura original: a própria origem já serve
+                if formato == 'webp' and largura == largura_original and origem.suffix.lower() == '.webp':
+                    destino = origem
+                else:
+                    destino = DIRETORIO_VARIANTES / f'{relativo.as_posix()}-{largura}w.{formato}'
+                    destino.parent.mkdir(parents=True, exist_ok=True)
+                    temporario = destino.with_name(destino.name + '.tmp')
+                    redimensionada.save(temporario, format=formato.upper(), **OPCOES_FORMATOS[formato])
+                    os.replace(temporario, destino)
+                variantes.append({'url': _url_publica(destino), 'formato': formato, 'largura': largura, 'altura': altura})
+
+    return {
+        'largura': largura_original,
+        'altura': altura_original,
+        'variantes': variantes,
+        'srcset': {
+            formato: ', '.join(f"{v['url']} {v['largura']}w" for v in variantes if v['formato'] == formato)
+            for formato in formatos
+        },
+    }
+
+
+def _variantes_existem(entrada: dict) -> bool:
+    return all((DIRETORIO_RAIZ / v['url'].lstrip('/')).exists() for v in entrada.get('variantes', []))
+
+
+def carregar_mapa_imagens(arquivo: Path = ARQUIVO_MAPA_IMAGENS) -> dict:
+    try:
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def salvar_mapa_imagens(mapa: dict, arquivo: Path = ARQUIVO_MAPA_IMAGENS):
+    arquivo.parent.mkdir(parents=True, exist_ok=True)
+    temporario = arquivo.with_name(arquivo.name + '.tmp')
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump(mapa, f, ensure_ascii=False, indent=2)
+    os.replace(temporario, arquivo)
+
+
+def remover_variantes_orfas(mapa_imagens: dict) -> int:
+    """Apaga variantes que já não pertencem a nenhuma imagem (origem removida ou larguras mudadas)."""
+    if not DIRETORIO_VARIANTES.exists():
+        return 0
+    em_uso = {v['url'] for entrada in mapa_imagens.values() for v in entrada['variantes']}
+    removidas = 0
+    for arquivo in DIRETORIO_VARIANTES.rglob('*'):
+        if arquivo.is_file() and _url_publica(arquivo) not in em_uso:
+            arquivo.unlink()
+            removidas += 1
+    return removidas
+
+
+def gerar_imagens_responsivas(processos: int | None = None, forcar: bool = False) -> dict:
+    """Gera as variantes em falta/desatualizadas e devolve o mapa completo (url da origem → entrada)."""
+    formatos = formatos_disponiveis()
+    if 'avif' not in formatos:
+        print('AVISO: Pillow sem suporte a AVIF; gerando apenas WebP.')
+    versao = _versao_configuracao(formatos)
+
+    anterior = carregar_mapa_imagens()
+    entradas_anteriores = anterior.get('imagens', {}) if anterior.get('versao') == versao and not forcar else {}
+
+    mapa_imagens = {}
+    pendentes = {}
+    for origem in listar_imagens_origem():
+        url = _url_publica(origem)
+        with open(origem, 'rb') as f:
+            hash_origem = hashlib.file_digest(f, 'sha256').hexdigest()
+        entrada = entradas_anteriores.get(url)
+        if entrada and entrada.get('hash') == hash_origem and _variantes_existem(entrada):
+            mapa_imagens[url] = entrada
+        else:
+            pendentes[url] = (origem, hash_origem)
+
+    print(f'Imagens: {len(mapa_imagens)} sem alterações, {len(pendentes)} a processar.')
+    if pendentes:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            futuros = {
+                url: executor.submit(_gerar_variantes_em_processo, str(origem), formatos)
+                for url, (origem, _) in pendentes.items()
+            }
+            for url, futuro in futuros.items():
+                try:
+                    entrada = futuro.result()
+                except Exception as e:
+                    print(f'ERRO ao processar {url}: {e}')
+                    continue
+                mapa_imagens[url] = {'hash': pendentes[url][1], **entrada}
+                print(f"  {url}: {len(entrada['variantes'])} variantes")
+
+    mapa_imagens = dict(sorted(mapa_imagens.items()))
+    removidas = remover_variantes_orfas(mapa_imagens)
+    if removidas:
+        print(f'Variantes órfãs removidas: {removidas}')
+
+    novo = {'versao': versao, 'imagens': mapa_imagens}
+    if novo != anterior:
+        salvar_mapa_imagens(novo)
+        print(f'Mapa de imagens salvo em: {ARQUIVO_MAPA_IMAGENS}')
+    return mapa_imagens
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Gera variantes responsivas (AVIF/WebP) das imagens dos projetos.')
+    parser.add_argument('--processos', type=int, default=None, help='Processos paralelos (padrão: número de CPUs).')
+    parser.add_argument('--forcar', action='store_true', help='Ignora os hashes guardados e regenera todas as variantes.')
+    args = parser.parse_args()
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print('ERRO: a etapa de imagens requer o Pillow (pip install -r requirements.txt).')
+        return 1
+
+    gerar_imagens_responsivas(processos=args.processos, forcar=args.forcar)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,431 @@
+"""
+Edição em lote dos dados embutidos no script.js (projetos.dadosProjetos).
+
+Substitui o antigo remove_dots.py (uma regex sobre o ficheiro inteiro, escrita sem cópia):
+- o literal é lido estruturalmente uma única vez (objetos, listas, strings, comentários),
+  guardando a posição de cada valor no texto original;
+- as regras declarativas são avaliadas todas na mesma travessia da árvore;
+- as alterações são aplicadas como cortes pontuais sobre o texto, pelo que a formatação
+  e os comentários fora dos valores alterados ficam intactos;
+- a escrita é atómica (ficheiro temporário + os.replace) e só acontece se houver mudanças;
+- --dry-run mostra o diff unificado sem escrever nada.
+
+Cada regra é um dicionário:
+    {
+        "descricao": "texto livre para o relatório",
+        "caminho": "[*].details[*]",      # relativo a dadosProjetos; [*] = todos os itens
+        "quando": {"title": "..."},       # opcional: campos que o objeto tem de ter
+        "remover": true                   # remove o valor do seu pai
+        | "definir": {"campo": valor}     # cria ou substitui campos do objeto
+        | "remover_campos": ["campo"]     # apaga campos do objeto
+    }
+
+Uso:
+    python scripts/reescrever_dados_script.py [--regras regras.json] [--dry-run] [--backup]
+"""
+import os
+import re
+import sys
+import json
+import shutil
+import difflib
+import argparse
+from pathlib import Path
+
+DIRETORIO_RAIZ = Path(__file__).resolve().parent.parent
+ARQUIVO_SCRIPT_JS = DIRETORIO_RAIZ / 'script.js'
+CHAVE_DADOS = 'dadosProjetos'
+
+# Regra herdada do remove_dots.py: blocos "Objetivo Principal" deixados com o texto de exemplo "..."
+REGRAS_PADRAO = [
+    {
+        'descricao': 'Remover blocos "Objetivo Principal" com conteúdo de exemplo',
+        'caminho': '[*].details[*]',
+        'quando': {'type': 'description', 'title': 'Objetivo Principal', 'content': '...'},
+        'remover': True,
+    },
+]
+
+
+class ErroLiteralJs(ValueError):
+    """O literal não pôde ser lido (sintaxe fora do subconjunto suportado)."""
+
+
+class NoLiteral:
+    """
+    Valor lido do literal com a sua posição [inicio, fim) no texto.
+    Objetos guardam `entradas` [(chave, inicio_da_chave, no)]; listas guardam `itens` [no].
+    """
+    __slots__ = ('tipo', 'inicio', 'fim', 'valor', 'entradas', 'itens')
+
+    def __init__(self, tipo: str, inicio: int, fim: int = -1, valor=None):
+        self.tipo = tipo
+        self.inicio = inicio
+        self.fim = fim
+        self.valor = valor
+        self.entradas = [] if tipo == 'objeto' else None
+        self.itens = [] if tipo == 'lista' else None
+
+    def para_python(self):
+        if self.tipo == 'objeto':
+            return {chave: no.para_python() for chave, _, no in self.entradas}
+        if self.tipo == 'lista':
+            return [no.para_python() for no in self.itens]
+        return self.valor
+
+    def obter(self, chave: str):
+        for nome, _, no in self.entradas or ():
+            if nome == chave:
+                return no
+        return None
+
+
+class LeitorLiteralJs:
+    """
+    Leitor recursivo do subconjunto de JavaScript usado nos dados do site: objetos (chaves
+    com ou sem aspas), listas, strings com aspas simples/duplas, números, true/false/null/
+    undefined, vírgulas finais e comentários // e /* */.
+    """
+    REGEX_NUMERO = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?')
+    REGEX_IDENTIFICADOR = re.compile(r'[A-Za-z_$][\w$]*')
+    REGEX_ESPACOS_E_COMENTARIOS = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)*', flags=re.DOTALL)
+    # Trecho literal de uma string até à próxima aspa, barra invertida ou quebra de linha
+    REGEX_TRECHO_STRING = {'"': re.compile(r'[^"\\\n]*'), "'": re.compile(r"[^'\\\n]*")}
+    CONSTANTES = {'true': True, 'false': False, 'null': None, 'undefined': None}
+    ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+
+    def __init__(self, texto: str):
+        self.texto = texto
+        self.pos = 0
+
+    def _erro(self, mensagem: str) -> ErroLiteralJs:
+        linha = self.texto.count('\n', 0, self.pos) + 1
+        return ErroLiteralJs(f'{mensagem} (linha {linha})')
+
+    def _saltar_espacos(self):
+        self.pos = self.REGEX_ESPACOS_E_COMENTARIOS.match(self.texto, self.pos).end()
+        if self.texto.startswith('/*', self.pos):
+            raise self._erro('Comentário sem fecho')
+
+    def ler_valor(self, posicao: int | None = None) -> NoLiteral:
+        if posicao is not None:
+            self.pos = posicao
+        self._saltar_espacos()
+        if self.pos >= len(self.texto):
+            raise self._erro('Fim inesperado do literal')
+        c = self.texto[self.pos]
+        if c == '{':
+            return self._ler_objeto()
+        if c == '[':
+            return self._ler_lista()
+        if c in '"\'':
+            inicio = self.pos
+            return NoLiteral('primitivo', inicio, valor=self._ler_string(), fim=self.pos)
+        m = self.REGEX_NUMERO.match(self.texto, self.pos)
+        if m:
+            self.pos = m.end()
+            numero = json.loads(m.group())
+            return NoLiteral('primitivo', m.start(), m.end(), numero)
+        m = self.REGEX_IDENTIFICADOR.match(self.texto, self.pos)
+        if m and m.group() in self.CONSTANTES:
+            self.pos = m.end()
+            return NoLiteral('primitivo', m.start(), m.end(), self.CONSTANTES[m.group()])
+        raise self._erro(f'Valor não suportado: {self.texto[self.pos:self.pos + 20]!r}')
+
+    def _ler_string(self) -> str:
+        aspas = self.texto[self.pos]
+        partes = []
+        i = self.pos + 1
+        texto = self.texto
+        trecho = self.REGEX_TRECHO_STRING[aspas]
+        while True:
+            fim = trecho.match(texto, i).end()
+            partes.append(texto[i:fim])
+            if fim >= len(texto) or texto[fim] == '\n':
+                self.pos = fim
+                raise self._erro('String sem fecho')
+            if texto[fim] == aspas:
+                self.pos = fim + 1
+                return ''.join(partes)
+            # Sequência de escape
+            seguinte = texto[fim + 1:fim + 2]
+            if seguinte == 'u':
+                partes.append(chr(int(texto[fim + 2:fim + 6], 16)))
+                i = fim + 6
+            elif seguinte == '\n':
+                i = fim + 2  # continuação de linha
+            else:
+                partes.append(self.ESCAPES.get(seguinte, seguinte))
+                i = fim + 2
+
+    def _ler_chave(self) -> str:
+        if self.texto[self.pos] in '"\'':
+            return self._ler_string()
+        m = self.REGEX_IDENTIFICADOR.match(self.texto, self.pos)
+        if not m:
+            raise self._erro('Chave de objeto inválida')
+        self.pos = m.end()
+        return m.group()
+
+    def _esperar_separador(self, fecho: str) -> bool:
+        """Consome ',' ou o fecho; devolve True quando o contentor terminou."""
+        self._saltar_espacos()
+        c = self.texto[self.pos:self.pos + 1]
+        if c == fecho:
+            self.pos += 1
+            return True
+        if c != ',':
+            raise self._erro(f"Esperado ',' ou '{fecho}'")
+        self.pos += 1
+        self._saltar_espacos()
+        if self.texto[self.pos:self.pos + 1] == fecho:  # vírgula final
+            self.pos += 1
+            return True
+        return False
+
+    def _ler_objeto(self) -> NoLiteral:
+        no = NoLiteral('objeto', self.pos)
+        self.pos += 1
+        self._saltar_espacos()
+        if self.texto[self.pos:self.pos + 1] == '}':
+            self.pos += 1
+            no.fim = self.pos
+            return no
+        while True:
+            self._saltar_espacos()
+            inicio_chave = self.pos
+            chave = self._ler_chave()
+            self._saltar_espacos()
+            if self.texto[self.pos:self.pos + 1] != ':':
+                raise self._erro(f"Esperado ':' após a chave {chave!r}")
+            self.pos += 1
+            no.entradas.append((chave, inicio_chave, self.ler_valor()))
+            if self._esperar_separador('}'):
+                no.fim = self.pos
+                return no
+
+    def _ler_lista(self) -> NoLiteral:
+        no = NoLiteral('lista', self.pos)
+        self.pos += 1
+        self._saltar_espacos()
+        if self.texto[self.pos:self.pos + 1] == ']':
+            self.pos += 1
+            no.fim = self.pos
+            return no
+        while True:
+            no.itens.append(self.ler_valor())
+            if self._esperar_separador(']'):
+                no.fim = self.pos
+                return no
+
+
+class ReescritorDadosScript:
+    """Avalia as regras sobre a árvore do literal e produz o texto com os cortes aplicados."""
+    REGEX_PASSO = re.compile(r'\.?([A-Za-z_$][\w$]*)|\[(\*|\d+)\]')
+
+    def __init__(self, regras: list[dict]):
+        self.regras = [self._compilar_regra(regra) for regra in regras]
+        self.contagem_por_regra = [0] * len(self.regras)
+
+    @classmethod
+    def _compilar_regra(cls, regra: dict) -> dict:
+        caminho = regra.get('caminho', '')
+        passos, pos = [], 0
+        while pos < len(caminho):
+            m = cls.REGEX_PASSO.match(caminho, pos)
+            if not m:
+                raise ValueError(f'Caminho inválido na regra: {caminho!r}')
+            passos.append(m.group(1) if m.group(1) else ('*' if m.group(2) == '*' else int(m.group(2))))
+            pos = m.end()
+        acoes = [a for a in ('remover', 'definir', 'remover_campos') if regra.get(a)]
+        if len(acoes) != 1:
+            raise ValueError(f"A regra {regra.get('descricao', caminho)!r} precisa de exatamente uma ação")
+        return {**regra, 'passos': passos, 'acao': acoes[0]}
+
+    @staticmethod
+    def _caminho_corresponde(passos: list, caminho: list) -> bool:
+        if len(passos) != len(caminho):
+            return False
+        return all(p == c or (p == '*' and isinstance(c, int)) for p, c in zip(passos, caminho))
+
+    @staticmethod
+    def _condicao_satisfeita(regra: dict, no: NoLiteral) -> bool:
+        quando = regra.get('quando')
+        if not quando:
+            return True
+        if no.tipo != 'objeto':
+            return False
+        for chave, esperado in quando.items():
+            valor = no.obter(chave)
+            if valor is None or valor.para_python() != esperado:
+                return False
+        return True
+
+    def aplicar(self, texto: str, raiz: NoLiteral) -> str:
+        remocoes = {}   # id(pai) -> (pai, conjunto de índices a remover)
+        edicoes = []    # (inicio, fim, novo_texto)
+
+        def visitar(no: NoLiteral, caminho: list, pai: NoLiteral | None, indice: int | None):
+            for i, regra in enumerate(self.regras):
+                if not self._caminho_corresponde(regra['passos'], caminho) or not self._condicao_satisfeita(regra, no):
+                    continue
+                self.contagem_por_regra[i] += 1
+                if regra['acao'] == 'remover':
+                    if pai is None:
+                        raise ValueError('Não é possível remover a raiz dos dados')
+                    remocoes.setdefault(id(pai), (pai, set()))[1].add(indice)
+                elif no.tipo == 'objeto':
+                    edicoes.extend(self._editar_objeto(texto, no, regra))
+            if no.tipo == 'lista':
+                for i, filho in enumerate(no.itens):
+                    visitar(filho, caminho + [i], no, i)
+            elif no.tipo == 'objeto':
+                for i, (chave, _, filho) in enumerate(no.entradas):
+                    visitar(filho, caminho + [chave], no, i)
+
+        visitar(raiz, [], None, None)
+        for pai, indices in remocoes.values():
+            edicoes.extend(self._cortes_de_remocao(texto, pai, indices))
+        return self._aplicar_edicoes(texto, edicoes)
+
+    @staticmethod
+    def _limites_filhos(pai: NoLiteral) -> list[tuple[int, int]]:
+        if pai.tipo == 'lista':
+            return [(no.inicio, no.fim) for no in pai.itens]
+        return [(inicio_chave, no.fim) for _, inicio_chave, no in pai.entradas]
+
+    @classmethod
+    def _cortes_de_remocao(cls, texto: str, pai: NoLiteral, indices: set) -> list[tuple[int, int, str]]:
+        """
+        Corta cada filho removido junto com o separador, preservando a indentação vizinha:
+        filhos no meio levam a vírgula e o espaço até ao próximo filho; um bloco final de
+        removidos leva a vírgula que o precede.
+        """
+        limites = cls._limites_filhos(pai)
+        total = len(limites)
+        inicio_bloco_final = total
+        while inicio_bloco_final > 0 and inicio_bloco_final - 1 in indices:
+            inicio_bloco_final -= 1
+
+        cortes = [(limites[i][0], limites[i + 1][0], '') for i in sorted(indices) if i < inicio_bloco_final]
+        if inicio_bloco_final < total:
+            if inicio_bloco_final > 0:
+                cortes.append((limites[inicio_bloco_final - 1][1], limites[-1][1], ''))
+            else:
+                # Todos removidos: esvaziar o contentor (mantém os delimitadores)
+                cortes.append((pai.inicio + 1, pai.fim - 1, ''))
+        return cortes
+
+    @staticmethod
+    def _indentacao_de(texto: str, posicao: int) -> str:
+        inicio_linha = texto.rfind('\n', 0, posicao) + 1
+        prefixo = texto[inicio_linha:posicao]
+        return prefixo if prefixo.isspace() else ''
+
+    def _editar_objeto(self, texto: str, no: NoLiteral, regra: dict) -> list[tuple[int, int, str]]:
+        edicoes = []
+        if regra['acao'] == 'remover_campos':
+            nomes = set(regra['remover_campos'])
+            indices = {i for i, (chave, _, _) in enumerate(no.entradas) if chave in nomes}
+            return self._cortes_de_remocao(texto, no, indices) if indices else []
+
+        novos = []
+        for chave, valor in regra['definir'].items():
+            existente = no.obter(chave)
+            serializado = json.dumps(valor, ensure_ascii=False)
+            if existente is not None:
+                if existente.para_python() != valor:
+                    edicoes.append((existente.inicio, existente.fim, serializado))
+            else:
+                novos.append(f'{json.dumps(chave, ensure_ascii=False)}: {serializado}')
+        if novos:
+            if no.entradas:
+                _, inicio_ultima, ultima = no.entradas[-1]
+                separador = ',\n' + self._indentacao_de(texto, inicio_ultima) if '\n' in texto[no.inicio:no.fim] else ', '
+                edicoes.append((ultima.fim, ultima.fim, ''.join(separador + novo for novo in novos)))
+            else:
+                edicoes.append((no.inicio + 1, no.fim - 1, ', '.join(novos)))
+        return edicoes
+
+    @staticmethod
+    def _aplicar_edicoes(texto: str, edicoes: list[tuple[int, int, str]]) -> str:
+        """Aplica os cortes numa única passagem; edições dentro de um trecho removido são descartadas."""
+        pedacos, cursor = [], 0
+        for inicio, fim, novo in sorted(edicoes, key=lambda e: (e[0], -e[1])):
+            if fim <= cursor and inicio < cursor:
+                continue  # contido num corte anterior
+            if inicio < cursor:
+                raise ValueError('Regras com alterações sobrepostas')
+            pedacos.append(texto[cursor:inicio])
+            pedacos.append(novo)
+            cursor = fim
+        pedacos.append(texto[cursor:])
+        return ''.join(pedacos)
+
+
+def localizar_literal_dados(texto: str, chave: str = CHAVE_DADOS) -> NoLiteral:
+    m = re.search(rf'["\']?{re.escape(chave)}["\']?\s*:\s*', texto)
+    if not m:
+        raise ErroLiteralJs(f'Chave {chave!r} não encontrada')
+    return LeitorLiteralJs(texto).ler_valor(m.end())
+
+
+def escrever_atomicamente(arquivo: Path, conteudo: str, backup: bool = False):
+    if backup:
+        shutil.copy2(arquivo, arquivo.with_name(arquivo.name + '.bak'))
+    temporario = arquivo.with_name(arquivo.name + '.tmp')
+    with open(temporario, 'w', encoding='utf-8', newline='') as f:
+        f.write(conteudo)
+    shutil.copymode(arquivo, temporario)
+    os.replace(temporario, arquivo)
+
+
+def carregar_regras(arquivo: Path | None) -> list[dict]:
+    if arquivo is None:
+        return REGRAS_PADRAO
+    with open(arquivo, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Aplica regras declarativas aos dados embutidos no script.js.')
+    parser.add_argument('--arquivo', type=Path, default=ARQUIVO_SCRIPT_JS, help='Ficheiro JS a editar (padrão: script.js).')
+    parser.add_argument('--regras', type=Path, help='JSON com a lista de regras (padrão: regras embutidas).')
+    parser.add_argument('--dry-run', action='store_true', help='Mostra o diff sem escrever o ficheiro.')
+    parser.add_argument('--backup', action='store_true', help='Guarda uma cópia .bak antes de escrever.')
+    args = parser.parse_args()
+
+    # newline='' preserva as quebras de linha originais (o diff e a escrita não as normalizam)
+    with open(args.arquivo, 'r', encoding='utf-8', newline='') as f:
+        texto = f.read()
+
+    regras = carregar_regras(args.regras)
+    reescritor = ReescritorDadosScript(regras)
+    try:
+        raiz = localizar_literal_dados(texto)
+    except ErroLiteralJs as e:
+        print(f'ERRO ao ler {CHAVE_DADOS} em {args.arquivo}: {e}')
+        return 1
+    novo_texto = reescritor.aplicar(texto, raiz)
+
+    for regra, total in zip(regras, reescritor.contagem_por_regra):
+        print(f"- {regra.get('descricao', regra.get('caminho'))}: {total} ocorrência(s)")
+
+    if novo_texto == texto:
+        print('Nenhuma alteração.')
+        return 0
+
+    if args.dry_run:
+        nome = str(args.arquivo)
+        sys.stdout.writelines(difflib.unified_diff(
+            texto.splitlines(keepends=True), novo_texto.splitlines(keepends=True),
+            fromfile=f'a/{nome}', tofile=f'b/{nome}'))
+        return 0
+
+    escrever_atomicamente(args.arquivo, novo_texto, backup=args.backup)
+    print(f'Alterações escritas em: {args.arquivo}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())